@@ -1,68 +1,172 @@
 """
 Simple size-limited cache for DevRev MCP server.
 
-Prevents unbounded memory growth by limiting cache size and using simple LRU eviction.
+Prevents unbounded memory growth by limiting both the number of cached entries
+and their total size, using simple LRU eviction. Entries also expire after a
+time-to-live so long-running sessions pick up changes made in DevRev, and can
+be tagged with the object they describe so every view of it can be dropped at once.
 """
 
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Set, Tuple, Union
 import json
+import time
 
 # Cache configuration constants
 DEFAULT_CACHE_SIZE = 500
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024  # 32 MiB of cached JSON text
+DEFAULT_CACHE_TTL = 300  # Seconds before a cached DevRev response is refetched
 
 
 class SimpleCache:
-    """Simple LRU cache with size limit to prevent memory leaks."""
+    """Simple LRU cache with entry and size limits to prevent memory leaks."""
     
-    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
-        """Initialize cache with maximum size limit."""
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        default_ttl: Optional[float] = None
+    ):
+        """Initialize cache with maximum entry count, total size and default lifetime limits."""
         self.max_size = max_size
-        self._cache: OrderedDict[str, str] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = 0
+        # Each entry keeps its size alongside the value so eviction never re-measures,
+        # plus its monotonic expiry time (None for entries that never expire)
+        self._cache: OrderedDict[str, Tuple[str, int, Optional[float]]] = OrderedDict()
+        # Tag -> keys stored under it, and the reverse mapping so eviction can untag
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, str] = {}
     
     def get(self, key: str) -> Optional[str]:
         """Get value from cache, moving it to end (most recently used)."""
-        if key in self._cache:
-            # Move to end (most recently used)
-            value = self._cache.pop(key)
-            self._cache[key] = value
-            return value
-        return None
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at = entry[2]
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.delete(key)
+            self.misses += 1
+            return None
+        # Move to end (most recently used)
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
     
-    def set(self, key: str, value: Union[str, Dict[str, Any]]) -> None:
-        """Set value in cache, evicting oldest if needed."""
-        # Convert dict to JSON string if needed
+    def set(
+        self,
+        key: str,
+        value: Union[str, Dict[str, Any]],
+        ttl: Optional[float] = None,
+        tag: Optional[str] = None
+    ) -> None:
+        """
+        Set value in cache, evicting oldest entries if over either limit.
+        
+        Args:
+            key: Cache key
+            value: JSON string, or a dict to store as compact JSON
+            ttl: Seconds until the entry expires; None uses the cache's default_ttl
+            tag: Object the value describes (e.g. "ticket:12345"), for delete_tag()
+        """
+        # Convert dict to compact JSON string if needed; pretty-printing is a
+        # presentation concern and only inflates what we keep in memory
         if isinstance(value, dict):
-            cache_value = json.dumps(value, indent=2)
+            cache_value = json.dumps(value, separators=(",", ":"))
         else:
             cache_value = str(value)
         
-        # Remove if already exists
-        if key in self._cache:
-            del self._cache[key]
+        # Measure the UTF-8 size; ASCII text (most JSON) is one byte per character,
+        # and str.isascii() is a flag check, so only non-ASCII values are encoded
+        nbytes = len(cache_value) if cache_value.isascii() else len(cache_value.encode("utf-8"))
+        
+        # Drop any previous value for this key before accounting for the new one
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= previous[1]
+            self._untag(key)
+        
+        # A single value larger than the whole budget is not worth caching
+        if nbytes > self.max_bytes:
+            return
         
         # Add to end
-        self._cache[key] = cache_value
+        if ttl is None:
+            ttl = self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._cache[key] = (cache_value, nbytes, expires_at)
+        self._total_bytes += nbytes
+        if tag is not None:
+            self._tags.setdefault(tag, set()).add(key)
+            self._key_tags[key] = tag
         
-        # Evict oldest if over limit
-        while len(self._cache) > self.max_size:
-            self._cache.popitem(last=False)  # Remove oldest (first item)
+        # Evict oldest until both the entry count and size budget are respected
+        while len(self._cache) > self.max_size or self._total_bytes > self.max_bytes:
+            evicted_key, (_, evicted_bytes, _) = self._cache.popitem(last=False)  # Remove oldest (first item)
+            self._total_bytes -= evicted_bytes
+            self._untag(evicted_key)
     
     def delete(self, key: str) -> bool:
         """Remove key from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._total_bytes -= entry[1]
+        self._untag(key)
+        return True
+    
+    def delete_tag(self, tag: str) -> int:
+        """Remove every entry stored under a tag, returning how many were removed."""
+        keys = self._tags.pop(tag, ())
+        removed = 0
+        for key in keys:
+            self._key_tags.pop(key, None)
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry[1]
+                removed += 1
+        return removed
+    
+    def _untag(self, key: str) -> None:
+        """Forget the tag of a key that is no longer cached."""
+        tag = self._key_tags.pop(key, None)
+        if tag is not None:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
     
     def size(self) -> int:
         """Get current number of cache entries."""
         return len(self._cache)
     
+    def size_bytes(self) -> int:
+        """Get approximate total size of cached values."""
+        return self._total_bytes
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get entry, size and hit/miss counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "max_entries": self.max_size,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "default_ttl": self.default_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0
+        }
+    
     def __contains__(self, key: str) -> bool:
-        """Check if key exists in cache."""
-        return key in self._cache
+        """Check if key exists in cache and has not expired."""
+        entry = self._cache.get(key)
+        return entry is not None and (entry[2] is None or entry[2] > time.monotonic())
 
 
 # Global cache instance - replaces devrev_cache = {}
-devrev_cache = SimpleCache(max_size=DEFAULT_CACHE_SIZE)
\ No newline at end of file
+devrev_cache = SimpleCache(max_size=DEFAULT_CACHE_SIZE, default_ttl=DEFAULT_CACHE_TTL)
@@ -4,10 +4,15 @@ DevRev MCP Error Handler
 Provides standardized error handling for resources and tools.
 """
 
+import inspect
 import json
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from functools import wraps
 from fastmcp import Context
+from .cache import SimpleCache
+
+# Seconds a DevRev 404 is remembered, so clients retrying a missing ID do not re-hit the API
+NOT_FOUND_TTL = 60
 
 
 class DevRevMCPError(Exception):
@@ -78,7 +83,69 @@ def create_error_response(
     if additional_data:
         error_data.update(additional_data)
     
-    return json.dumps(error_data, indent=2)
+    # Error responses are consumed by MCP clients, not humans; skip pretty-printing
+    return json.dumps(error_data, separators=(",", ":"))
+
+
+def is_error_response(data: Any) -> bool:
+    """
+    Check whether decoded resource content is an error built by create_error_response.
+    
+    Resource handlers return errors as JSON instead of raising, so callers that
+    compose or cache other resources use this to avoid caching a failure.
+    """
+    return isinstance(data, dict) and data.get("error") is True
+
+
+def cache_not_found(
+    devrev_cache: SimpleCache,
+    cache_key: str,
+    response,
+    endpoint: str,
+    resource_type: str,
+    resource_id: str
+) -> str:
+    """
+    Build the error response for a 404 and briefly cache it as the resource's value.
+    
+    Args:
+        devrev_cache: Cache the resource handler stores its results in
+        cache_key: The handler's cache key for this resource
+        response: The 404 requests Response object
+        endpoint: API endpoint that was called
+        resource_type: Type of resource (ticket, artifact, etc.)
+        resource_id: ID of the resource that was not found
+    
+    Returns:
+        JSON string containing error information
+    """
+    error_value = create_error_response(
+        APIError(endpoint, response.status_code, response.text), resource_type, resource_id
+    )
+    devrev_cache.set(cache_key, error_value, ttl=NOT_FOUND_TTL)
+    return error_value
+
+
+def _context_locator(func) -> Callable[[tuple, dict], Optional[Context]]:
+    """
+    Resolve where a handler receives its FastMCP Context, once at decoration time.
+    
+    Args:
+        func: The handler being decorated
+    
+    Returns:
+        Function mapping a call's (args, kwargs) to its Context, or None
+    """
+    for index, param in enumerate(inspect.signature(func).parameters.values()):
+        if param.annotation is Context or param.name == "ctx":
+            name = param.name
+            
+            def locate(args: tuple, kwargs: Dict[str, Any]) -> Optional[Context]:
+                return args[index] if len(args) > index else kwargs.get(name)
+            
+            return locate
+    
+    return lambda args, kwargs: None
 
 
 def resource_error_handler(resource_type: str):
@@ -92,27 +159,24 @@ def resource_error_handler(resource_type: str):
         Decorated function with error handling
     """
     def decorator(func):
+        find_context = _context_locator(func)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Extract resource_id from function arguments
-            resource_id = args[0] if args else "unknown"
-            ctx = None
-            
-            # Find Context in arguments
-            for arg in args:
-                if isinstance(arg, Context):
-                    ctx = arg
-                    break
-            
             try:
                 return await func(*args, **kwargs)
             
             except DevRevMCPError as e:
+                # Resource ID and Context are only needed to report the failure
+                resource_id = args[0] if args else "unknown"
+                ctx = find_context(args, kwargs)
                 if ctx:
                     await ctx.error(f"{resource_type} error: {e.message}")
                 return create_error_response(e, resource_type, resource_id)
             
             except Exception as e:
+                resource_id = args[0] if args else "unknown"
+                ctx = find_context(args, kwargs)
                 if ctx:
                     await ctx.error(f"Unexpected error in {resource_type} {resource_id}: {str(e)}")
                 
@@ -139,28 +203,21 @@ def tool_error_handler(tool_name: str):
         Decorated function with error handling
     """
     def decorator(func):
+        find_context = _context_locator(func)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            ctx = None
-            
-            # Find Context in arguments or kwargs
-            for arg in args:
-                if isinstance(arg, Context):
-                    ctx = arg
-                    break
-            
-            if not ctx and 'ctx' in kwargs:
-                ctx = kwargs['ctx']
-            
             try:
                 return await func(*args, **kwargs)
             
             except DevRevMCPError as e:
+                ctx = find_context(args, kwargs)
                 if ctx:
                     await ctx.error(f"{tool_name} error: {e.message}")
                 raise  # Re-raise for tools since they can handle exceptions
             
             except Exception as e:
+                ctx = find_context(args, kwargs)
                 if ctx:
                     await ctx.error(f"Unexpected error in {tool_name}: {str(e)}")
                 
@@ -222,4 +279,4 @@ def validate_resource_id(resource_id: str, resource_type: str) -> str:
             {"reason": "Empty resource ID after normalization"}
         )
     
-    return resource_id
\ No newline at end of file
+    return resource_id
@@ -5,21 +5,27 @@ Provides specialized resource access for DevRev artifacts with metadata and down
 """
 
 import json
+import sys
 from fastmcp import Context
-from ..utils import make_devrev_request
-from ..error_handler import resource_error_handler, handle_api_response, validate_resource_id
+from ..utils import make_devrev_request_async, parse_json_response, single_flight, INFO_LOGGING_ENABLED
+from ..error_handler import resource_error_handler, handle_api_response, validate_resource_id, cache_not_found
 from ..endpoints import ARTIFACTS_GET, ARTIFACTS_LOCATE
+from ..cache import SimpleCache
+
+# File fields that already carry a usable download URL
+_FILE_URL_KEYS = frozenset(("download_url", "url"))
 
 
 @resource_error_handler("artifact")
-async def artifact(artifact_id: str, ctx: Context, devrev_cache: dict) -> str:
+@single_flight
+async def artifact(artifact_id: str, ctx: Context, devrev_cache: SimpleCache) -> str:
     """
     Access DevRev artifact metadata.
     
     Args:
         artifact_id: The DevRev artifact ID
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for storing results
+        devrev_cache: Cache for storing results
     
     Returns:
         JSON string containing the artifact metadata
@@ -27,59 +33,71 @@ async def artifact(artifact_id: str, ctx: Context, devrev_cache: dict) -> str:
     # Validate the artifact ID
     artifact_id = validate_resource_id(artifact_id, "artifact")
     
-    cache_key = f"artifact:{artifact_id}"
+    cache_key = sys.intern("artifact:" + artifact_id)
     
     # Check cache first
     cached_value = devrev_cache.get(cache_key)
     if cached_value is not None:
-        await ctx.info(f"Retrieved artifact {artifact_id} from cache")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Retrieved artifact {artifact_id} from cache")
         return cached_value
     
-    await ctx.info(f"Fetching artifact {artifact_id} from DevRev API")
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Fetching artifact {artifact_id} from DevRev API")
     
     # For artifacts, use artifacts.get endpoint
-    response = make_devrev_request(
+    response = await make_devrev_request_async(
         ARTIFACTS_GET,
         {"id": artifact_id}
     )
     
     # Handle API response with standardized error handling
+    if response.status_code == 404:
+        await ctx.error(f"Artifact {artifact_id} not found")
+        return cache_not_found(devrev_cache, cache_key, response, ARTIFACTS_GET, "artifact", artifact_id)
     handle_api_response(response, ARTIFACTS_GET)
     
-    result = response.json()
+    result = parse_json_response(response)
     
     # Try to get download URL if available through artifacts.locate
     artifact_info = result.get("artifact", {})
-    if artifact_info and not any(key in artifact_info.get("file", {}) for key in ["download_url", "url"]):
+    file_obj = artifact_info.get("file") or {}
+    # Skip the extra round trip when either level already carries a URL
+    has_url = bool(_FILE_URL_KEYS & file_obj.keys()) or "download_url" in artifact_info
+    if artifact_info and not has_url:
         try:
-            await ctx.info(f"Attempting to get download URL for artifact {artifact_id}")
-            locate_response = make_devrev_request(
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Attempting to get download URL for artifact {artifact_id}")
+            locate_response = await make_devrev_request_async(
                 ARTIFACTS_LOCATE,
                 {"id": artifact_id}
             )
             
             if locate_response.status_code == 200:
-                locate_data = locate_response.json()
+                locate_data = parse_json_response(locate_response)
                 locate_artifact = locate_data.get("artifact", {})
                 if locate_artifact:
                     # Merge locate data into the main artifact data
                     if "download_url" in locate_artifact:
                         artifact_info["download_url"] = locate_artifact["download_url"]
                     if "file" in locate_artifact and "download_url" in locate_artifact["file"]:
-                        if "file" not in artifact_info:
-                            artifact_info["file"] = {}
-                        artifact_info["file"]["download_url"] = locate_artifact["file"]["download_url"]
-                    await ctx.info(f"Successfully added download URL for artifact {artifact_id}")
+                        artifact_info["file"] = file_obj
+                        file_obj["download_url"] = locate_artifact["file"]["download_url"]
+                    if INFO_LOGGING_ENABLED:
+                        await ctx.info(f"Successfully added download URL for artifact {artifact_id}")
             else:
-                await ctx.info(f"artifacts.locate not available for {artifact_id}: HTTP {locate_response.status_code}")
+                if INFO_LOGGING_ENABLED:
+                    await ctx.info(f"artifacts.locate not available for {artifact_id}: HTTP {locate_response.status_code}")
         except Exception as locate_error:
-            await ctx.info(f"Could not locate download URL for artifact {artifact_id}: {str(locate_error)}")
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Could not locate download URL for artifact {artifact_id}: {str(locate_error)}")
             # Continue without download URL
     
     
     # Cache the result
-    cache_value = json.dumps(result, indent=2)
+    cache_value = json.dumps(result, separators=(",", ":"))
     devrev_cache.set(cache_key, cache_value)
-    await ctx.info(f"Successfully retrieved and cached artifact: {artifact_id}")
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Successfully retrieved and cached artifact: {artifact_id}")
     
     return cache_value
\ No newline at end of file
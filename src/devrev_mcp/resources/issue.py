@@ -4,100 +4,95 @@ DevRev Issue Resource Handler
 Provides specialized resource access for DevRev issues with enriched timeline and artifact data.
 """
 
+import asyncio
 import json
+import sys
+from typing import Any, Dict, List, Set
 from fastmcp import Context
-from ..utils import make_devrev_request, fetch_linked_work_items
-from ..error_handler import resource_error_handler
+from ..utils import make_devrev_request_async, parse_json_response, fetch_linked_work_items, single_flight, work_item_cache_tag, parse_issue_number, INFO_LOGGING_ENABLED
+from ..error_handler import resource_error_handler, ResourceNotFoundError
 from ..endpoints import WORKS_GET, TIMELINE_ENTRIES_LIST
+from ..cache import SimpleCache
 
 
 @resource_error_handler("issue")
-async def issue(issue_number: str, ctx: Context, devrev_cache: dict) -> str:
+@single_flight
+async def issue(issue_number: str, ctx: Context, devrev_cache: SimpleCache) -> str:
     """
     Access DevRev issue details with enriched timeline entries and artifact data.
     
     Args:
         issue_number: The numeric DevRev issue number (e.g., "9031")
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for storing results
+        devrev_cache: Cache for storing results
     
     Returns:
         JSON string containing the issue data with timeline entries and artifacts
     """
+    parsed_number = parse_issue_number(issue_number)
+    if parsed_number is None:
+        raise ResourceNotFoundError("issue", issue_number, {"reason": "Expected a numeric issue ID or ISS-<number>"})
+    issue_number = parsed_number
+    
     # Use the display ID format that the API expects
-    issue_id = f"ISS-{issue_number}"
-    cache_key = f"devrev://issues/{issue_number}"
+    issue_id = "ISS-" + issue_number
+    cache_key = sys.intern(f"devrev://issues/{issue_number}")
     
     # Check cache first
     cached_value = devrev_cache.get(cache_key)
     if cached_value is not None:
-        await ctx.info(f"Retrieved issue {issue_number} from cache")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Retrieved issue {issue_number} from cache")
         return cached_value
     
-    await ctx.info(f"Fetching issue {issue_id} from DevRev API")
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Fetching issue {issue_id} from DevRev API")
     
     # Get issue details using the display ID
-    response = make_devrev_request(WORKS_GET, {"id": issue_id})
+    response = await make_devrev_request_async(WORKS_GET, {"id": issue_id})
     
     if response.status_code != 200:
         error_text = response.text
         await ctx.error(f"Failed to fetch issue {issue_id}: HTTP {response.status_code} - {error_text}")
         raise ValueError(f"Failed to fetch issue {issue_id} (HTTP {response.status_code}): {error_text}")
     
-    result = response.json()
+    result = parse_json_response(response)
     
     # Extract the work object from the API response
     if isinstance(result, dict) and "work" in result:
         result = result["work"]
     
+    # Timeline entries and linked work items are independent, so fetch them concurrently
+    work_item_don_id = result.get("id", issue_id)  # Use the full don:core ID from the API response
+    timeline_response, linked_work_items = await asyncio.gather(
+        make_devrev_request_async(TIMELINE_ENTRIES_LIST, {"object": issue_id}),
+        fetch_linked_work_items(
+            work_item_id=work_item_don_id,
+            work_item_display_id=issue_id,
+            work_item_type="issue",
+            ctx=ctx,
+            cache=devrev_cache
+        ),
+        return_exceptions=True
+    )
+    
     # Get timeline entries for the issue
     try:
-        timeline_response = make_devrev_request(
-            TIMELINE_ENTRIES_LIST,
-            {"object": issue_id}
-        )
+        if isinstance(timeline_response, Exception):
+            raise timeline_response
         
         if timeline_response.status_code == 200:
-            timeline_data = timeline_response.json()
+            timeline_data = parse_json_response(timeline_response)
             timeline_entries = timeline_data.get("timeline_entries", [])
             result["timeline_entries"] = timeline_entries
-            await ctx.info(f"Added {len(timeline_entries)} timeline entries to issue {issue_id}")
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Added {len(timeline_entries)} timeline entries to issue {issue_id}")
             
             # Extract artifact data directly from timeline entries (no additional API calls needed)
-            artifacts = []
-            seen_artifact_ids = set()  # Avoid duplicates across timeline entries
-            
-            for entry in timeline_entries:
-                if "artifacts" in entry:
-                    for artifact in entry["artifacts"]:
-                        # Timeline entries contain full artifact objects, not just IDs
-                        if isinstance(artifact, dict):
-                            artifact_id = artifact.get("id", "")
-                            if artifact_id and artifact_id not in seen_artifact_ids:
-                                seen_artifact_ids.add(artifact_id)
-                                
-                                # Add navigation link for downloading
-                                artifact_id_clean = artifact_id.split("/")[-1] if "/" in artifact_id else artifact_id
-                                artifact["links"] = {
-                                    "download": f"devrev://artifacts/{artifact_id_clean}/download",
-                                    "issue": f"devrev://issues/{issue_number}"
-                                }
-                                artifacts.append(artifact)
-                        elif isinstance(artifact, str):
-                            # Fallback: if it's just an ID string, create minimal artifact object
-                            if artifact not in seen_artifact_ids:
-                                seen_artifact_ids.add(artifact)
-                                artifact_id_clean = artifact.split("/")[-1] if "/" in artifact else artifact
-                                artifacts.append({
-                                    "id": artifact,
-                                    "links": {
-                                        "download": f"devrev://artifacts/{artifact_id_clean}/download",
-                                        "issue": f"devrev://issues/{issue_number}"
-                                    }
-                                })
-            
+            artifacts = _extract_artifacts(timeline_entries, f"devrev://issues/{issue_number}")
             result["artifacts"] = artifacts
-            await ctx.info(f"Extracted {len(artifacts)} artifacts from timeline entries for issue {issue_number}")
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Extracted {len(artifacts)} artifacts from timeline entries for issue {issue_number}")
             
         else:
             await ctx.warning(f"Could not fetch timeline entries for issue {issue_number}")
@@ -108,15 +103,9 @@ async def issue(issue_number: str, ctx: Context, devrev_cache: dict) -> str:
         result["timeline_entries"] = []
         result["artifacts"] = []
     
-    # Get linked work items using the reusable utility function
-    work_item_don_id = result.get("id", issue_id)  # Use the full don:core ID from the API response
-    linked_work_items = await fetch_linked_work_items(
-        work_item_id=work_item_don_id,
-        work_item_display_id=issue_id,
-        work_item_type="issue",
-        ctx=ctx,
-        cache=devrev_cache
-    )
+    if isinstance(linked_work_items, Exception):
+        await ctx.warning(f"Error fetching linked work items for issue {issue_number}: {str(linked_work_items)}")
+        linked_work_items = []
 
     # Add navigation links
     result["links"] = {
@@ -126,8 +115,66 @@ async def issue(issue_number: str, ctx: Context, devrev_cache: dict) -> str:
     }
     
     # Cache the enriched result
-    cache_value = json.dumps(result, indent=2, default=str)
-    devrev_cache.set(cache_key, cache_value)
-    await ctx.info(f"Successfully retrieved and cached issue: {issue_number}")
+    cache_value = json.dumps(result, separators=(",", ":"))
+    devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(issue_id))
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Successfully retrieved and cached issue: {issue_number}")
+    
+    return cache_value
+
+
+def _extract_artifacts(timeline_entries: List[Dict[str, Any]], issue_uri: str) -> List[Dict[str, Any]]:
+    """
+    Collect the unique artifacts attached to timeline entries, adding navigation links.
+    
+    Kept free of I/O and fully annotated so this hot loop can be profiled or
+    compiled on its own.
+    
+    Args:
+        timeline_entries: Timeline entries as returned by timeline-entries.list
+        issue_uri: Resource URI of the issue the entries belong to
+    
+    Returns:
+        Artifact objects in first-seen order, each with download and issue links
+    """
+    artifacts: List[Dict[str, Any]] = []
+    seen_artifact_ids: Set[str] = set()  # Avoid duplicates across timeline entries
+    
+    # Bind hot-loop lookups once; timelines can carry hundreds of artifacts
+    mark_seen = seen_artifact_ids.add
+    append_artifact = artifacts.append
+    
+    for entry in timeline_entries:
+        for artifact in entry.get("artifacts") or ():
+            # Decoded JSON only yields exact dict/str, so compare types directly
+            artifact_type = type(artifact)
+            # Timeline entries contain full artifact objects, not just IDs
+            if artifact_type is dict:
+                artifact_id = artifact.get("id", "")
+                if not artifact_id or artifact_id in seen_artifact_ids:
+                    continue
+                mark_seen(artifact_id)
+                
+                # Add navigation link for downloading
+                artifact_id_clean = artifact_id.rpartition("/")[2] or artifact_id
+                artifact["links"] = {
+                    "download": f"devrev://artifacts/{artifact_id_clean}/download",
+                    "issue": issue_uri
+                }
+                append_artifact(artifact)
+            elif artifact_type is str:
+                # Fallback: if it's just an ID string, create minimal artifact object
+                if artifact in seen_artifact_ids:
+                    continue
+                mark_seen(artifact)
+                
+                artifact_id_clean = artifact.rpartition("/")[2] or artifact
+                append_artifact({
+                    "id": artifact,
+                    "links": {
+                        "download": f"devrev://artifacts/{artifact_id_clean}/download",
+                        "issue": issue_uri
+                    }
+                })
     
-    return cache_value
\ No newline at end of file
+    return artifacts
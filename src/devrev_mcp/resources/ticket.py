@@ -4,75 +4,109 @@ DevRev Ticket Resource Handler
 Provides specialized resource access for DevRev tickets with enriched timeline and artifact data.
 """
 
+import asyncio
 import json
+import sys
 from fastmcp import Context
-from ..utils import make_devrev_request, fetch_linked_work_items, read_resource_content
-from ..error_handler import resource_error_handler
+from ..utils import make_devrev_request_async, parse_json_response, fetch_linked_work_items, read_resource_content, single_flight, work_item_cache_tag, parse_ticket_number, INFO_LOGGING_ENABLED
+from ..error_handler import resource_error_handler, ResourceNotFoundError, is_error_response, cache_not_found, create_error_response
 from ..endpoints import WORKS_GET, TIMELINE_ENTRIES_LIST
+from ..cache import SimpleCache
+from .ticket_artifacts import artifacts_from_timeline
 
 
 @resource_error_handler("ticket")
-async def ticket(ticket_number: str, ctx: Context, devrev_cache: dict) -> str:
+@single_flight
+async def ticket(ticket_number: str, ctx: Context, devrev_cache: SimpleCache) -> str:
     """
     Access DevRev ticket details with enriched timeline entries and artifact data.
     
     Args:
         ticket_number: The numeric DevRev ticket ID (e.g., "12345")
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for storing results
+        devrev_cache: Cache for storing results
     
     Returns:
         JSON string containing the ticket data with timeline entries and artifacts
     """
+    parsed_number = parse_ticket_number(ticket_number)
+    if parsed_number is None:
+        raise ResourceNotFoundError("ticket", ticket_number, {"reason": "Expected a numeric ticket ID or TKT-<number>"})
+    ticket_number = parsed_number
+    
     # Use the display ID format that the API expects
-    ticket_id = f"TKT-{ticket_number}"
-    cache_key = f"devrev://tickets/{ticket_number}"
+    ticket_id = "TKT-" + ticket_number
+    cache_key = sys.intern(f"devrev://tickets/{ticket_number}")
     
     # Check cache first
     cached_value = devrev_cache.get(cache_key)
     if cached_value is not None:
-        await ctx.info(f"Retrieved ticket {ticket_number} from cache")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Retrieved ticket {ticket_number} from cache")
         return cached_value
     
-    await ctx.info(f"Fetching ticket {ticket_id} from DevRev API")
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Fetching ticket {ticket_id} from DevRev API")
     
     # Get ticket details using the display ID
-    response = make_devrev_request(WORKS_GET, {"id": ticket_id})
+    response = await make_devrev_request_async(WORKS_GET, {"id": ticket_id})
     
+    if response.status_code == 404:
+        await ctx.error(f"Ticket {ticket_id} not found")
+        return cache_not_found(devrev_cache, cache_key, response, WORKS_GET, "ticket", ticket_number)
     if response.status_code != 200:
         error_text = response.text
         await ctx.error(f"Failed to fetch ticket {ticket_id}: HTTP {response.status_code} - {error_text}")
         raise ValueError(f"Failed to fetch ticket {ticket_id} (HTTP {response.status_code}): {error_text}")
     
-    result = response.json()
+    result = parse_json_response(response)
     
     # Extract the work object from the API response
     if isinstance(result, dict) and "work" in result:
         result = result["work"]
     
-    # Get timeline entries for the ticket
-
-    
-    # Get linked work items using the reusable utility function
+    # Timeline and linked work items are independent, so fetch them concurrently
     work_item_don_id = result.get("id", ticket_id)  # Use the full don:core ID from the API response
-    linked_work_items = await fetch_linked_work_items(
-        work_item_id=work_item_don_id,
-        work_item_display_id=ticket_id,
-        work_item_type="ticket",
-        ctx=ctx,
-        cache=devrev_cache
+    timeline, linked_work_items = await asyncio.gather(
+        read_resource_content(ctx, f"devrev://tickets/{ticket_number}/timeline", parse_json=True),
+        fetch_linked_work_items(
+            work_item_id=work_item_don_id,
+            work_item_display_id=ticket_id,
+            work_item_type="ticket",
+            ctx=ctx,
+            cache=devrev_cache
+        ),
+        return_exceptions=True
     )
     
+    # Either fetch can fail on its own; keep whatever the other one returned
+    if isinstance(timeline, Exception):
+        await ctx.warning(f"Error fetching timeline for ticket {ticket_number}: {str(timeline)}")
+        timeline = json.loads(create_error_response(timeline, "timeline", ticket_number))
+    if isinstance(linked_work_items, Exception):
+        await ctx.warning(f"Error fetching linked work items for ticket {ticket_number}: {str(linked_work_items)}")
+        linked_work_items = []
+    
+    # The artifacts resource is a view of the timeline, so derive it from the copy already in hand
+    if is_error_response(timeline):
+        artifacts = timeline
+    else:
+        artifacts = artifacts_from_timeline(ticket_number, timeline)
+    
     # Add navigation links (artifacts are now directly included in the ticket data)
     result["links"] = {
-        "timeline": await read_resource_content(ctx, f"devrev://tickets/{ticket_number}/timeline", parse_json=True), 
+        "timeline": timeline, 
         "works": linked_work_items,
-        "artifacts": await read_resource_content(ctx, f"devrev://tickets/{ticket_number}/artifacts", parse_json=True)
+        "artifacts": artifacts
     }
     
-    # Cache the enriched result
-    cache_value = json.dumps(result, indent=2, default=str)
-    devrev_cache.set(cache_key, cache_value)
-    await ctx.info(f"Successfully retrieved and cached ticket: {ticket_number}")
+    # Cache the enriched result, unless a sub-resource failed and would be stuck in the cache
+    cache_value = json.dumps(result, separators=(",", ":"))
+    if is_error_response(timeline):
+        await ctx.warning(f"Not caching ticket {ticket_number}: timeline could not be loaded")
+        return cache_value
+    devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(ticket_id))
+    if INFO_LOGGING_ENABLED:
+        await ctx.info(f"Successfully retrieved and cached ticket: {ticket_number}")
     
     return cache_value
\ No newline at end of file
@@ -5,44 +5,79 @@ Provides access to all artifacts associated with a specific ticket.
 """
 
 import json
+import sys
+from typing import Any, Dict
 from fastmcp import Context
-from .ticket import ticket as ticket_resource
-from ..error_handler import resource_error_handler
+from .timeline import timeline as timeline_resource
+from ..utils import work_item_cache_tag, INFO_LOGGING_ENABLED
+from ..error_handler import resource_error_handler, is_error_response
+from ..cache import SimpleCache
 
 
 @resource_error_handler("ticket_artifacts")
-async def ticket_artifacts(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
+async def ticket_artifacts(ticket_id: str, ctx: Context, devrev_cache: SimpleCache) -> str:
     """
     Access all artifacts for a ticket.
     
     Args:
         ticket_id: The DevRev ticket ID (e.g., 12345 for TKT-12345)
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for storing results
+        devrev_cache: Cache for storing results
     
     Returns:
         JSON string containing artifacts with navigation links
     """
-    # Get ticket data to extract artifacts
-    ticket_data_str = await ticket_resource(ticket_id, ctx, devrev_cache)
+    # Serve the already-encoded view on repeat reads instead of re-decoding the timeline
+    cache_key = sys.intern(f"devrev://tickets/{ticket_id}/artifacts")
+    cached_value = devrev_cache.get(cache_key)
+    if cached_value is not None:
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Retrieved artifacts for ticket {ticket_id} from cache")
+        return cached_value
     
-    ticket_data = json.loads(ticket_data_str)
-    artifacts = ticket_data.get("artifacts", [])
+    # Get artifacts from the ticket timeline. Going through ticket() would also fetch
+    # the work item and its links, and ticket() itself reads this resource
+    timeline_data_str = await timeline_resource(ticket_id, ctx, devrev_cache)
+    
+    timeline_data = json.loads(timeline_data_str)
+    if is_error_response(timeline_data):
+        # Pass the failure through without caching a view of it
+        return timeline_data_str
+    result = artifacts_from_timeline(ticket_id, timeline_data)
+    
+    cache_value = json.dumps(result, separators=(",", ":"))
+    devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(ticket_id, "ticket"))
+    return cache_value
+
+
+def artifacts_from_timeline(ticket_id: str, timeline_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the ticket artifacts view from an already decoded ticket timeline.
+    
+    Args:
+        ticket_id: The DevRev ticket ID (e.g., 12345 for TKT-12345)
+        timeline_data: Decoded timeline resource content, left unmodified
+    
+    Returns:
+        Dictionary containing artifacts with navigation links
+    """
+    artifacts = []
+    ticket_uri = f"devrev://tickets/{ticket_id}"  # Shared by every artifact's links
     
     # Add navigation links to each artifact
-    for artifact in artifacts:
-        artifact_id = artifact.get("id", "").split("/")[-1] if artifact.get("id") else ""
+    for artifact in timeline_data.get("all_artifacts", []):
+        artifact_id = (artifact.get("id") or "").rpartition("/")[2]
         if artifact_id:
+            artifact = dict(artifact)
             artifact["links"] = {
                 "self": f"devrev://artifacts/{artifact_id}",
-                "ticket": f"devrev://tickets/{ticket_id}"
+                "ticket": ticket_uri
             }
+        artifacts.append(artifact)
     
-    result = {
+    return {
         "artifacts": artifacts,
         "links": {
-            "ticket": f"devrev://tickets/{ticket_id}"
+            "ticket": ticket_uri
         }
     }
-    
-    return json.dumps(result, indent=2) 
\ No newline at end of file
@@ -4,14 +4,24 @@ DevRev Timeline Resource Handler
 Provides enriched timeline access for DevRev tickets with conversation flow and visibility information.
 """
 
+import asyncio
 import json
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple
 from fastmcp import Context
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, single_flight, work_item_cache_tag, INFO_LOGGING_ENABLED
 from ..types import VisibilityInfo, format_visibility_summary
-from ..error_handler import resource_error_handler
+from ..error_handler import resource_error_handler, cache_not_found
 from ..endpoints import WORKS_GET, TIMELINE_ENTRIES_LIST
+from ..cache import SimpleCache
+
+
 @resource_error_handler("timeline")
-async def timeline(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
+@single_flight
+async def timeline(ticket_id: str, ctx: Context, devrev_cache: SimpleCache) -> str:
     """
     Access enriched timeline for a ticket with structured conversation format.
     
@@ -24,63 +34,35 @@ async def timeline(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
     """
     try:
         # ticket_id is already normalized by server.py pattern matching
-        cache_key = f"ticket_timeline:{ticket_id}"
+        cache_key = sys.intern(f"ticket_timeline:{ticket_id}")
         
         # Check cache first
         cached_value = devrev_cache.get(cache_key)
         if cached_value is not None:
-            await ctx.info(f"Retrieved timeline for {ticket_id} from cache")
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Retrieved timeline for {ticket_id} from cache")
             return cached_value
         
-        await ctx.info(f"Fetching timeline for {ticket_id} from DevRev API")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching timeline for {ticket_id} from DevRev API")
         
-        # Get ticket details for customer and workspace info
-        ticket_response = make_devrev_request(WORKS_GET, {"id": ticket_id})
+        # The ticket details (for customer and workspace info) and the first timeline
+        # page only depend on ticket_id, so fetch them concurrently
+        page_limit = 50  # Use DevRev's default limit
+        max_pages = 50  # Safety limit to prevent infinite loops
+        ticket_response, timeline_response = await asyncio.gather(
+            make_devrev_request_async(WORKS_GET, {"id": ticket_id}),
+            make_devrev_request_async(TIMELINE_ENTRIES_LIST, {"object": ticket_id, "limit": page_limit})
+        )
+        if ticket_response.status_code == 404:
+            await ctx.error(f"Ticket {ticket_id} not found")
+            return cache_not_found(devrev_cache, cache_key, ticket_response, WORKS_GET, "timeline", ticket_id)
         if ticket_response.status_code != 200:
             raise ValueError(f"Failed to fetch ticket {ticket_id}")
         
-        ticket_data = ticket_response.json()
+        ticket_data = parse_json_response(ticket_response)
         work = ticket_data.get("work", {})
         
-        # Get timeline entries with pagination
-        all_entries = []
-        cursor = None
-        page_count = 0
-        max_pages = 50  # Safety limit to prevent infinite loops
-        
-        while page_count < max_pages:
-            request_payload = {
-                "object": ticket_id,
-                "limit": 50  # Use DevRev's default limit
-            }
-            if cursor:
-                request_payload["cursor"] = cursor
-                request_payload["mode"] = "after"  # Get entries after this cursor
-            
-            timeline_response = make_devrev_request(
-                TIMELINE_ENTRIES_LIST,
-                request_payload
-            )
-            
-            if timeline_response.status_code != 200:
-                raise ValueError(f"Failed to fetch timeline for {ticket_id}")
-            
-            timeline_data = timeline_response.json()
-            page_entries = timeline_data.get("timeline_entries", [])
-            all_entries.extend(page_entries)
-            
-            # Check for next page using DevRev's cursor system
-            cursor = timeline_data.get("next_cursor")
-            page_count += 1
-            
-            await ctx.info(f"DEBUG: Fetched page {page_count} with {len(page_entries)} entries, total so far: {len(all_entries)}")
-            
-            # Break if no more pages or no entries in this page
-            if not cursor or len(page_entries) == 0:
-                break
-        
-        await ctx.info(f"DEBUG: Found {len(all_entries)} timeline entries for {ticket_id}")
-        
         # Extract customer information
         customer_info = {}
         created_by = work.get("created_by", {})
@@ -91,14 +73,18 @@ async def timeline(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
                 "type": "customer" if created_by.get("type") == "user" else "system"
             }
         
+        # Bind optional fields once instead of allocating throw-away defaults
+        owners = work.get("owned_by")
+        stage = work.get("stage")
+        
         # Build enriched schema
         result = {
             "summary": {
                 "ticket_id": ticket_id,
                 "customer": customer_info.get("email", customer_info.get("name", "Unknown")),
-                "workspace": work.get("owned_by", [{}])[0].get("display_name", "Unknown Workspace") if work.get("owned_by") else "Unknown Workspace",
+                "workspace": owners[0].get("display_name", "Unknown Workspace") if owners else "Unknown Workspace",
                 "subject": work.get("title", "No title"),
-                "current_stage": work.get("stage", {}).get("name", "unknown"),
+                "current_stage": stage.get("name", "unknown") if stage is not None else "unknown",
                 "created_date": work.get("created_date"),
                 "total_artifacts": 0
             },
@@ -107,163 +93,67 @@ async def timeline(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
             "all_artifacts": []
         }
         
-        # Process timeline entries into conversation and events
-        conversation_seq = 1
-        artifacts_found = {}
+        # Per-ticket invariants and running counters shared by the entry handlers
+        builder = _TimelineBuilder(
+            ticket_id=ticket_id,
+            customer_email=customer_info.get("email"),
+            result=result
+        )
         
-        for entry in all_entries:
-            entry_type = entry.get("type", "")
-            timestamp = entry.get("created_date", "")
+        # Get timeline entries with pagination; later pages depend on the previous cursor,
+        # so each page is scheduled as soon as its cursor is known
+        entry_count = 0
+        page_count = 0
+        
+        while True:
+            if timeline_response.status_code != 200:
+                raise ValueError(f"Failed to fetch timeline for {ticket_id}")
             
-            # Extract visibility information
-            visibility_raw = entry.get("visibility")
-            visibility_info = VisibilityInfo.from_visibility(visibility_raw)
+            timeline_data = parse_json_response(timeline_response)
+            page_entries = timeline_data.get("timeline_entries", [])
+            entry_count += len(page_entries)
             
-            # Handle conversation entries (comments)
-            if entry_type == "timeline_comment":
-                body = entry.get("body", "")
-                author = entry.get("created_by", {})
-                
-                # Determine speaker type
-                speaker_type = "support"
-                if author.get("email") == customer_info.get("email"):
-                    speaker_type = "customer"
-                elif "system" in author.get("display_name", "").lower():
-                    speaker_type = "system"
-                
-                conversation_entry = {
-                    "seq": conversation_seq,
-                    "timestamp": timestamp,
-                    "event_type": entry_type,
-                    "speaker": {
-                        "name": author.get("display_name", author.get("email", "Unknown")),
-                        "type": speaker_type
-                    },
-                    "message": body,
-                    "artifacts": [],
-                    "visibility_info": visibility_info.to_dict()
-                }
-                
-                # Add artifacts if present
-                if entry.get("artifacts"):
-                    for artifact in entry["artifacts"]:
-                        artifact_id = artifact.get("id")
-                        artifact_info = {
-                            "id": artifact_id,
-                            "display_id": artifact.get("display_id"),
-                            "type": artifact.get("file", {}).get("type", "unknown"),
-                            "attached_to_message": conversation_seq,
-                            "resource_uri": f"devrev://artifacts/{artifact_id}"
-                        }
-                        conversation_entry["artifacts"].append(artifact_info)
-                        artifacts_found[artifact_id] = artifact_info
-                
-                # Add timeline entry navigation link
-                entry_id = entry.get("id", "").split("/")[-1] if entry.get("id") else ""
-                if entry_id:
-                    conversation_entry["timeline_entry_uri"] = f"devrev://tickets/{ticket_id}/timeline/{entry_id}"
-                
-                result["conversation_thread"].append(conversation_entry)
-                conversation_seq += 1
-                
-                # Update last message timestamps
-                if speaker_type == "customer":
-                    result["summary"]["last_customer_message"] = timestamp
-                elif speaker_type == "support":
-                    result["summary"]["last_support_response"] = timestamp
+            # Check for next page using DevRev's cursor system
+            cursor = timeline_data.get("next_cursor")
+            page_count += 1
             
-            # Handle key events
-            elif entry_type in ["work_created", "stage_updated", "part_suggested", "work_updated"]:
-                event_info = {
-                    "type": entry_type.replace("work_", "").replace("_", " "),
-                    "event_type": entry_type,
-                    "timestamp": timestamp,
-                    "visibility_info": visibility_info.to_dict()
-                }
-                
-                # Add context for stage updates
-                if entry_type == "stage_updated" and entry.get("stage_updated"):
-                    stage_info = entry["stage_updated"]
-                    event_info["from_stage"] = stage_info.get("old_stage", {}).get("name")
-                    event_info["to_stage"] = stage_info.get("new_stage", {}).get("name")
-                
-                # Add author information if available
-                author = entry.get("created_by", {})
-                if author:
-                    event_info["actor"] = {
-                        "name": author.get("display_name", author.get("email", "System")),
-                        "type": "customer" if author.get("email") == customer_info.get("email") else "support"
+            # Stop after this page if there are no more pages, no entries in this page, or the page cap is reached
+            next_page = None
+            if cursor and len(page_entries) > 0 and page_count < max_pages:
+                next_page = asyncio.create_task(make_devrev_request_async(
+                    TIMELINE_ENTRIES_LIST,
+                    {
+                        "object": ticket_id,
+                        "limit": page_limit,
+                        "cursor": cursor,
+                        "mode": "after"  # Get entries after this cursor
                     }
-                
-                result["key_events"].append(event_info)
+                ))
             
-            # Handle all other event types to preserve information
-            else:
-                # Skip entries without meaningful content
-                if not entry_type or entry_type in ["", "unknown"]:
-                    continue
-                
-                # Determine if this is likely a conversation-like entry
-                body = entry.get("body", "").strip()
-                author = entry.get("created_by", {})
-                
-                if body:  # Has content, treat as conversation
-                    speaker_type = "support"
-                    if author.get("email") == customer_info.get("email"):
-                        speaker_type = "customer"
-                    elif "system" in author.get("display_name", "").lower():
-                        speaker_type = "system"
-                    
-                    conversation_entry = {
-                        "seq": conversation_seq,
-                        "timestamp": timestamp,
-                        "event_type": entry_type,
-                        "speaker": {
-                            "name": author.get("display_name", author.get("email", "Unknown")),
-                            "type": speaker_type
-                        },
-                        "message": body,
-                        "artifacts": [],
-                        "visibility_info": visibility_info.to_dict()
-                    }
-                    
-                    # Add timeline entry navigation link
-                    entry_id = entry.get("id", "").split("/")[-1] if entry.get("id") else ""
-                    if entry_id:
-                        conversation_entry["timeline_entry_uri"] = f"devrev://tickets/{ticket_id}/timeline/{entry_id}"
-                    
-                    result["conversation_thread"].append(conversation_entry)
-                    conversation_seq += 1
-                    
-                    # Update last message timestamps
-                    if speaker_type == "customer":
-                        result["summary"]["last_customer_message"] = timestamp
-                    elif speaker_type == "support":
-                        result["summary"]["last_support_response"] = timestamp
-                        
-                else:  # No content, treat as event
-                    event_info = {
-                        "type": entry_type.replace("_", " "),
-                        "event_type": entry_type,
-                        "timestamp": timestamp,
-                        "visibility_info": visibility_info.to_dict()
-                    }
-                    
-                    # Add author information if available
-                    if author:
-                        event_info["actor"] = {
-                            "name": author.get("display_name", author.get("email", "System")),
-                            "type": "customer" if author.get("email") == customer_info.get("email") else "support"
-                        }
-                    
-                    result["key_events"].append(event_info)
+            # Process timeline entries into conversation and events
+            try:
+                for entry in page_entries:
+                    entry_type = entry.get("type", "")
+                    _ENTRY_HANDLERS.get(entry_type, _handle_other_entry)(builder, entry, entry_type)
+            except BaseException:
+                # Don't leave the next page's request running with nobody to await it
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            
+            if next_page is None:
+                break
+            timeline_response = await next_page
+        
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Found {entry_count} timeline entries for {ticket_id} across {page_count} pages")
         
         # Set artifact count and list
-        result["all_artifacts"] = list(artifacts_found.values())
-        result["summary"]["total_artifacts"] = len(artifacts_found)
+        result["all_artifacts"] = list(builder.artifacts_found.values())
+        result["summary"]["total_artifacts"] = len(builder.artifacts_found)
         
         # Add visibility summary to the result
-        all_entries_with_visibility = result["conversation_thread"] + result["key_events"]
+        all_entries_with_visibility = chain(result["conversation_thread"], result["key_events"])
         result["visibility_summary"] = format_visibility_summary(all_entries_with_visibility)
         
         # Add navigation links
@@ -275,12 +165,176 @@ async def timeline(ticket_id: str, ctx: Context, devrev_cache: dict) -> str:
             result["links"]["artifacts"] = f"devrev://tickets/{ticket_id}/artifacts"
         
         # Cache the enriched result
-        cache_value = json.dumps(result, indent=2)
-        devrev_cache.set(cache_key, cache_value)
-        await ctx.info(f"Successfully retrieved and cached timeline: {ticket_id}")
+        cache_value = json.dumps(result, separators=(",", ":"))
+        devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(ticket_id, "ticket"))
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Successfully retrieved and cached timeline: {ticket_id}")
         
         return cache_value
         
     except Exception as e:
         await ctx.error(f"Failed to get timeline for ticket {ticket_id}: {str(e)}")
-        raise ValueError(f"Timeline for ticket {ticket_id} not found: {str(e)}") 
\ No newline at end of file
+        raise ValueError(f"Timeline for ticket {ticket_id} not found: {str(e)}") 
+
+
+@dataclass
+class _TimelineBuilder:
+    """Accumulates the enriched timeline while entries are classified page by page."""
+    ticket_id: str
+    customer_email: Optional[str]
+    result: Dict[str, Any]
+    conversation_seq: int = 1
+    artifacts_found: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+# Shared stand-in for entries without an author; read-only, never mutated
+_NO_AUTHOR: Dict[str, Any] = {}
+
+
+def _entry_context(entry: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """Extract the timestamp, author and visibility shared by every entry kind."""
+    # from_visibility is memoized per level; to_dict gives each entry its own copy
+    visibility = VisibilityInfo.from_visibility(entry.get("visibility")).to_dict()
+    return entry.get("created_date", ""), entry.get("created_by") or _NO_AUTHOR, visibility
+
+
+@lru_cache(maxsize=256)
+def _is_system_name(display_name: str) -> bool:
+    """Whether an author name looks like a system account, memoized per name."""
+    return "system" in display_name.lower()
+
+
+def _speaker_type(author: Dict[str, Any], customer_email: Optional[str]) -> str:
+    """Classify who wrote a conversation entry."""
+    if author.get("email") == customer_email:
+        return "customer"
+    if _is_system_name(author.get("display_name", "")):
+        return "system"
+    return "support"
+
+
+def _add_conversation_entry(
+    builder: _TimelineBuilder,
+    entry: Dict[str, Any],
+    entry_type: str,
+    timestamp: str,
+    author: Dict[str, Any],
+    message: str,
+    visibility: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Append an entry to the conversation thread and return it."""
+    speaker_type = _speaker_type(author, builder.customer_email)
+    conversation_entry = {
+        "seq": builder.conversation_seq,
+        "timestamp": timestamp,
+        "event_type": entry_type,
+        "speaker": {
+            "name": author.get("display_name", author.get("email", "Unknown")),
+            "type": speaker_type
+        },
+        "message": message,
+        "artifacts": [],
+        "visibility_info": visibility
+    }
+    
+    # Add timeline entry navigation link
+    entry_id = (entry.get("id") or "").rpartition("/")[2]
+    if entry_id:
+        conversation_entry["timeline_entry_uri"] = f"devrev://tickets/{builder.ticket_id}/timeline/{entry_id}"
+    
+    builder.result["conversation_thread"].append(conversation_entry)
+    builder.conversation_seq += 1
+    
+    # Update last message timestamps
+    if speaker_type == "customer":
+        builder.result["summary"]["last_customer_message"] = timestamp
+    elif speaker_type == "support":
+        builder.result["summary"]["last_support_response"] = timestamp
+    
+    return conversation_entry
+
+
+def _add_key_event(
+    builder: _TimelineBuilder,
+    event_info: Dict[str, Any],
+    author: Dict[str, Any]
+) -> None:
+    """Attach the actor, if known, and append the event to key_events."""
+    if author:
+        event_info["actor"] = {
+            "name": author.get("display_name", author.get("email", "System")),
+            "type": "customer" if author.get("email") == builder.customer_email else "support"
+        }
+    
+    builder.result["key_events"].append(event_info)
+
+
+def _handle_comment(builder: _TimelineBuilder, entry: Dict[str, Any], entry_type: str) -> None:
+    """Comments become conversation entries, together with any attached artifacts."""
+    timestamp, author, visibility = _entry_context(entry)
+    conversation_entry = _add_conversation_entry(
+        builder, entry, entry_type, timestamp, author, entry.get("body", ""), visibility
+    )
+    
+    # Add artifacts if present
+    for artifact in entry.get("artifacts") or ():
+        artifact_id = artifact.get("id")
+        artifact_info = {
+            "id": artifact_id,
+            "display_id": artifact.get("display_id"),
+            "type": artifact.get("file", {}).get("type", "unknown"),
+            "attached_to_message": conversation_entry["seq"],
+            "resource_uri": f"devrev://artifacts/{artifact_id}"
+        }
+        conversation_entry["artifacts"].append(artifact_info)
+        builder.artifacts_found[artifact_id] = artifact_info
+
+
+def _handle_key_event(builder: _TimelineBuilder, entry: Dict[str, Any], entry_type: str) -> None:
+    """Known work lifecycle events become key events."""
+    timestamp, author, visibility = _entry_context(entry)
+    event_info = {
+        "type": entry_type.replace("work_", "").replace("_", " "),
+        "event_type": entry_type,
+        "timestamp": timestamp,
+        "visibility_info": visibility
+    }
+    
+    # Add context for stage updates
+    if entry_type == "stage_updated" and entry.get("stage_updated"):
+        stage_info = entry["stage_updated"]
+        event_info["from_stage"] = stage_info.get("old_stage", {}).get("name")
+        event_info["to_stage"] = stage_info.get("new_stage", {}).get("name")
+    
+    _add_key_event(builder, event_info, author)
+
+
+def _handle_other_entry(builder: _TimelineBuilder, entry: Dict[str, Any], entry_type: str) -> None:
+    """Other entry types are kept as conversation if they have a body, else as events."""
+    # Skip entries without meaningful content
+    if not entry_type or entry_type == "unknown":
+        return
+    
+    timestamp, author, visibility = _entry_context(entry)
+    body = entry.get("body", "").strip()
+    
+    if body:  # Has content, treat as conversation
+        _add_conversation_entry(builder, entry, entry_type, timestamp, author, body, visibility)
+    else:  # No content, treat as event
+        event_info = {
+            "type": entry_type.replace("_", " "),
+            "event_type": entry_type,
+            "timestamp": timestamp,
+            "visibility_info": visibility
+        }
+        _add_key_event(builder, event_info, author)
+
+
+# Entry type -> handler; anything not listed goes to _handle_other_entry
+_ENTRY_HANDLERS = {
+    "timeline_comment": _handle_comment,
+    "work_created": _handle_key_event,
+    "stage_updated": _handle_key_event,
+    "part_suggested": _handle_key_event,
+    "work_updated": _handle_key_event,
+}
@@ -5,75 +5,134 @@ Provides specialized resource access for DevRev timeline entries with conversati
 """
 
 import json
+import re
+import sys
+from typing import Any, Dict, Optional
 from fastmcp import Context
-from ..utils import make_devrev_request
-from ..error_handler import resource_error_handler
+from ..utils import make_devrev_request_async, parse_json_response, append_json_field, work_item_cache_tag, INFO_LOGGING_ENABLED
+from ..error_handler import resource_error_handler, cache_not_found
 from ..endpoints import TIMELINE_ENTRIES_GET
+from ..cache import SimpleCache
+
+# Ticket number inside a timeline entry's parent object ID
+_TICKET_OBJECT_RE = re.compile(r"TKT-(\d+)")
 
 
 @resource_error_handler("timeline_entry")
-async def timeline_entry(timeline_id: str, ctx: Context, devrev_cache: dict) -> str:
+async def timeline_entry(
+    timeline_id: str,
+    ctx: Context,
+    devrev_cache: SimpleCache,
+    ticket_number: Optional[str] = None
+) -> str:
     """
     Access specific timeline entry details.
     
     Args:
         timeline_id: The DevRev timeline entry ID (full don: format)
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for storing results
+        devrev_cache: Cache for storing results
+        ticket_number: Numeric ID of the ticket the entry was requested through; when
+            given, links point to that ticket instead of being derived from the entry
     
     Returns:
         JSON string containing the timeline entry data
     """
     try:
-        cache_key = f"timeline_entry:{timeline_id}"
+        if ticket_number is not None:
+            cache_key = sys.intern(f"devrev://tickets/{ticket_number}/timeline/{timeline_id}")
+        else:
+            cache_key = sys.intern(f"timeline_entry:{timeline_id}")
         
         # Check cache first
         cached_value = devrev_cache.get(cache_key)
         if cached_value is not None:
-            await ctx.info(f"Retrieved timeline entry {timeline_id} from cache")
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Retrieved timeline entry {timeline_id} from cache")
             return cached_value
         
-        await ctx.info(f"Fetching timeline entry {timeline_id} from DevRev API")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching timeline entry {timeline_id} from DevRev API")
         
         # For timeline entries, use timeline-entries.get endpoint
-        response = make_devrev_request(
+        response = await make_devrev_request_async(
             TIMELINE_ENTRIES_GET,
             {"id": timeline_id}
         )
         
+        if response.status_code == 404:
+            await ctx.error(f"Timeline entry {timeline_id} not found")
+            return cache_not_found(devrev_cache, cache_key, response, TIMELINE_ENTRIES_GET, "timeline_entry", timeline_id)
         if response.status_code != 200:
             error_text = response.text
             await ctx.error(f"Failed to fetch timeline entry {timeline_id}: HTTP {response.status_code} - {error_text}")
             raise ValueError(f"Failed to fetch timeline entry {timeline_id} (HTTP {response.status_code}): {error_text}")
         
-        result = response.json()
+        result = parse_json_response(response)
         
         # Add navigation links
-        # Extract ticket ID from the timeline entry if available
-        ticket_id = None
-        if "object" in result:
-            object_id = result["object"]
-            if "TKT-" in object_id:
-                ticket_id = object_id.replace("TKT-", "")
-        
-        links = {}
-        if ticket_id:
-            links["ticket"] = f"devrev://tickets/{ticket_id}"
-            links["ticket_timeline"] = f"devrev://tickets/{ticket_id}/timeline"
-        
-        # Add links to artifacts if any are attached
-        if "artifacts" in result and result["artifacts"]:
-            links["artifacts"] = [f"devrev://artifacts/{artifact_id}" for artifact_id in result["artifacts"]]
+        if ticket_number is not None:
+            links = {
+                "ticket": f"devrev://tickets/{ticket_number}",
+                "timeline": f"devrev://tickets/{ticket_number}/timeline"
+            }
+            tag = work_item_cache_tag(ticket_number, "ticket")
+        else:
+            # Extract ticket ID from the timeline entry if available
+            ticket_match = _TICKET_OBJECT_RE.search(result.get("object") or "")
+            ticket_id = ticket_match.group(1) if ticket_match else None
+            
+            links = {}
+            if ticket_id:
+                links["ticket"] = f"devrev://tickets/{ticket_id}"
+                links["ticket_timeline"] = f"devrev://tickets/{ticket_id}/timeline"
+            
+            # Tag the entry with its parent work item so writes to it drop this entry too
+            tag = work_item_cache_tag(ticket_id, "ticket") if ticket_id else work_item_cache_tag(result.get("object") or "")
+            
+            # Add links to artifacts if any are attached
+            if "artifacts" in result and result["artifacts"]:
+                links["artifacts"] = [f"devrev://artifacts/{artifact_id}" for artifact_id in result["artifacts"]]
         
-        result["links"] = links
-        
-        # Cache the result
-        cache_value = json.dumps(result, indent=2)
-        devrev_cache.set(cache_key, cache_value)
-        await ctx.info(f"Successfully retrieved and cached timeline entry: {timeline_id}")
+        # Cache the result, splicing the links into the upstream body instead of
+        # re-encoding the whole entry when there is nothing to overwrite
+        if "links" in result:
+            result["links"] = links
+            cache_value = json.dumps(result, separators=(",", ":"))
+        else:
+            cache_value = append_json_field(response.content.decode("utf-8"), "links", links)
+        devrev_cache.set(cache_key, cache_value, tag=tag)
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Successfully retrieved and cached timeline entry: {timeline_id}")
         
         return cache_value
         
     except Exception as e:
         await ctx.error(f"Failed to get timeline resource {timeline_id}: {str(e)}")
-        raise ValueError(f"Timeline resource {timeline_id} not found: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Timeline resource {timeline_id} not found: {str(e)}")
+
+
+def find_timeline_entry(timeline_data: Dict[str, Any], ticket_number: str, entry_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Pick a conversation entry out of an already built ticket timeline by its short ID.
+    
+    Args:
+        timeline_data: Decoded timeline resource content, left unmodified
+        ticket_number: Numeric ID of the ticket the timeline belongs to
+        entry_id: Last segment of the timeline entry ID, as used in timeline_entry_uri
+    
+    Returns:
+        Copy of the matching conversation entry with navigation links, or None if the
+        timeline has no such entry
+    """
+    ticket_uri = f"devrev://tickets/{ticket_number}"
+    entry_uri = f"{ticket_uri}/timeline/{entry_id}"
+    for entry in timeline_data.get("conversation_thread", ()):
+        if entry.get("timeline_entry_uri") == entry_uri:
+            entry = dict(entry)
+            entry["links"] = {
+                "ticket": ticket_uri,
+                "timeline": f"{ticket_uri}/timeline"
+            }
+            return entry
+    return None
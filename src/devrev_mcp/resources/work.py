@@ -9,14 +9,20 @@ via the devrev://work/{work_id} URI format.
 """
 
 import json
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Tuple
 from fastmcp import Context
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, single_flight, work_item_cache_tag, INFO_LOGGING_ENABLED
 from ..endpoints import WORKS_GET
-from ..error_handler import resource_error_handler
+from ..error_handler import resource_error_handler, NOT_FOUND_TTL
+from ..cache import SimpleCache
 
 
 @resource_error_handler("works")
-async def works(work_id: str, ctx: Context, cache=None) -> str:
+@single_flight
+async def works(work_id: str, ctx: Context, cache: SimpleCache | None = None) -> str:
     """
     Access DevRev work item details using unified work ID format.
     
@@ -29,14 +35,16 @@ async def works(work_id: str, ctx: Context, cache=None) -> str:
         JSON string containing the work item data with navigation links
     """
     try:
-        await ctx.info(f"Fetching work item {work_id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching work item {work_id}")
         
         # Check cache first if available
-        cache_key = f"work_{work_id}"
+        cache_key = sys.intern(f"work_{work_id}")
         if cache:
             cached_result = cache.get(cache_key)
             if cached_result:
-                await ctx.info(f"Using cached data for work item {work_id}")
+                if INFO_LOGGING_ENABLED:
+                    await ctx.info(f"Using cached data for work item {work_id}")
                 return cached_result
         
         # Normalize work_id to the format expected by the API
@@ -51,43 +59,48 @@ async def works(work_id: str, ctx: Context, cache=None) -> str:
             "id": normalized_work_id
         }
         
-        response = make_devrev_request(WORKS_GET, payload)
+        response = await make_devrev_request_async(WORKS_GET, payload)
         
         if response.status_code != 200:
             await ctx.error(f"DevRev API returned status {response.status_code}")
-            return json.dumps({
+            result = json.dumps({
                 "error": f"Failed to fetch work item {work_id}",
                 "status_code": response.status_code,
                 "message": response.text
-            })
+            }, separators=(",", ":"))
+            # Remember missing IDs briefly so repeated probes do not re-hit the API
+            if cache and response.status_code == 404:
+                cache.set(cache_key, result, ttl=NOT_FOUND_TTL)
+            return result
         
-        data = response.json()
+        data = parse_json_response(response)
         work_item = data.get("work")
         
         if not work_item:
-            return json.dumps({
+            result = json.dumps({
                 "error": f"Work item {work_id} not found",
                 "message": "No work item found with the provided ID"
-            })
+            }, separators=(",", ":"))
+            if cache:
+                cache.set(cache_key, result, ttl=NOT_FOUND_TTL)
+            return result
         work_type = work_item.get("type", "unknown")
         
-        # Enhance the work item data with navigation links
-        enhanced_work = {
-            **work_item,
-            "links": _build_navigation_links(work_item),
-            "metadata": {
-                "resource_type": "work",
-                "work_type": work_type,
-                "fetched_at": data.get("next_cursor", ""),
-                "api_version": "v1"
-            }
+        # Enhance the work item data with navigation links; the decoded response is not
+        # used elsewhere, so add them in place rather than copying every field
+        work_item["links"] = _build_navigation_links(work_item)
+        work_item["metadata"] = {
+            "resource_type": "work",
+            "work_type": work_type,
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "api_version": "v1"
         }
         
-        result = json.dumps(enhanced_work, indent=2, default=str)
+        result = json.dumps(work_item, separators=(",", ":"))
         
-        # Cache the result if cache is available
+        # Cache the result if cache is available, tagged so writes through any ID form drop it
         if cache:
-            cache.set(cache_key, result)  # Cache result
+            cache.set(cache_key, result, tag=work_item_cache_tag(work_item.get("display_id") or work_id, work_type))
             
         return result
         
@@ -96,7 +109,7 @@ async def works(work_id: str, ctx: Context, cache=None) -> str:
         return json.dumps({
             "error": f"Failed to fetch work item {work_id}",
             "message": str(e)
-        })
+        }, separators=(",", ":"))
 
 
 def _build_navigation_links(work_item: dict) -> dict:
@@ -107,23 +120,30 @@ def _build_navigation_links(work_item: dict) -> dict:
         work_item: The work item data from DevRev API
     
     Returns:
-        Dictionary of navigation links
+        Dictionary of navigation links, freshly built for this work item
     """
-    display_id = work_item.get("display_id", "")
-    work_type = work_item.get("type", "unknown")
-    
-    links = {
-        "self": f"devrev://work/{display_id}",
-    }
+    return dict(_navigation_links(work_item.get("display_id", ""), work_item.get("type", "unknown")))
+
+
+@lru_cache(maxsize=4096)
+def _navigation_links(display_id: str, work_type: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Build the navigation links for a display ID and work type, memoized per pair.
     
+    Returned as immutable (name, uri) pairs so the memoized value can't be changed
+    through a work item that holds it.
+    """
     # Add type-specific links
     if work_type == "ticket" and display_id.startswith("TKT-"):
-        # Extract numeric ID for ticket-specific resources
-        numeric_id = display_id.replace("TKT-", "")
-        links.update({
-            "ticket": f"devrev://tickets/{numeric_id}",
-            "timeline": f"devrev://tickets/{numeric_id}/timeline",
-            "artifacts": f"devrev://tickets/{numeric_id}/artifacts"
-        })
+        # Extract numeric ID for ticket-specific resources; the prefix is already known
+        ticket_uri = f"devrev://tickets/{display_id[4:]}"
+        return (
+            ("self", f"devrev://work/{display_id}"),
+            ("ticket", ticket_uri),
+            ("timeline", ticket_uri + "/timeline"),
+            ("artifacts", ticket_uri + "/artifacts")
+        )
     
-    return links
\ No newline at end of file
+    return (
+        ("self", f"devrev://work/{display_id}"),
+    )
\ No newline at end of file
@@ -5,16 +5,19 @@ SPDX-License-Identifier: MIT
 This module implements the FastMCP server for DevRev integration.
 """
 
+import asyncio
 import json
-from typing import Dict, Any
+import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, List, Tuple
 
 from fastmcp import FastMCP, Context
-from mcp import types
 
 # Import modular resources and tools
 from .resources.ticket import ticket as ticket_resource
 from .resources.timeline import timeline as timeline_resource
-from .resources.timeline_entry import timeline_entry as timeline_entry_resource
+from .resources.timeline_entry import timeline_entry as timeline_entry_resource, find_timeline_entry
 from .resources.artifact import artifact as artifact_resource
 from .resources.ticket_artifacts import ticket_artifacts as ticket_artifacts_resource
 from .resources.work import works as work_resource
@@ -30,21 +33,35 @@ from .tools.get_work import get_work as get_work_tool
 from .tools.get_issue import get_issue as get_issue_tool
 from .tools.create_timeline_comment import create_timeline_comment as create_timeline_comment_tool
 
-# Import new types for visibility handling
-from .types import VisibilityInfo, TimelineEntryType, format_visibility_summary
+@asynccontextmanager
+async def _prefetch_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm the tickets in DEVREV_PREFETCH_IDS in the background once the server loop is running."""
+    prefetch_ids = os.environ.get("DEVREV_PREFETCH_IDS", "")
+    if not prefetch_ids:
+        yield
+        return
+    
+    # Clients can connect and be served while the warm-up is still in flight
+    task = asyncio.create_task(_prefetch_tickets(prefetch_ids.split(",")))
+    try:
+        yield
+    finally:
+        task.cancel()
 
 # Create the FastMCP server
 mcp = FastMCP(
     name="devrev_mcp",
     version="0.1.1",
-    description="DevRev MCP Server - Provides tools for interacting with DevRev API"
+    description="DevRev MCP Server - Provides tools for interacting with DevRev API",
+    lifespan=_prefetch_lifespan
 )
 
 # Import cache utility to prevent unbounded memory growth
 from .cache import devrev_cache
 
 # Import the fetch_linked_work_items utility
-from .utils import fetch_linked_work_items
+from .utils import fetch_linked_work_items, work_item_cache_tag, parse_ticket_number, parse_issue_number, SessionManager
+from .error_handler import is_error_response, create_error_response, ResourceNotFoundError
 
 @mcp.tool(
     name="search",
@@ -200,6 +217,7 @@ ARTIFACT_RESOURCE_TAGS = ["artifact", "devrev", "files", "metadata", "download"]
 WORK_RESOURCE_TAGS = ["work", "devrev", "unified", "tickets", "issues", "navigation"]
 ISSUE_RESOURCE_TAGS = ["issue", "devrev", "internal-work", "navigation"]
 LINKS_RESOURCE_TAGS = ["links", "devrev", "relationships", "navigation", "metadata"]
+DIAGNOSTICS_RESOURCE_TAGS = ["diagnostics", "devrev", "cache"]
 
 @mcp.resource(
     uri="devrev://tickets/{ticket_id}",
@@ -256,8 +274,9 @@ async def ticket_timeline(ctx: Context, ticket_id: str = None, ticket_number: st
     Returns:
         JSON string containing enriched timeline with customer context and conversation flow
     """
-    # Normalize to ticket number
-    numeric_id = ticket_id or ticket_number
+    # Normalize to ticket number; other IDs pass through for the handler to reject
+    raw_id = ticket_id or ticket_number
+    numeric_id = parse_ticket_number(raw_id) or raw_id
     return await timeline_resource(numeric_id, ctx, devrev_cache)
 
 @mcp.resource(
@@ -287,25 +306,31 @@ async def timeline_entry(ctx: Context, ticket_id: str = None, ticket_number: str
     Returns:
         JSON string containing the timeline entry data with links
     """
-    # Normalize to ticket number
-    numeric_id = ticket_id or ticket_number
+    # Normalize to ticket number; other IDs pass through for the handler to reject
+    raw_id = ticket_id or ticket_number
+    numeric_id = parse_ticket_number(raw_id) or raw_id
     
     # Construct full timeline ID if needed
     if not entry_id.startswith("don:core:"):
-        # This is a simplified ID, we'll need to fetch it via the ticket timeline
-        return await timeline_resource(numeric_id, ctx, devrev_cache)
-    
-    result = await timeline_entry_resource(entry_id, ctx, devrev_cache)
-    
-    # Add navigation links
-    import json
-    entry_data = json.loads(result)
-    entry_data["links"] = {
-        "ticket": f"devrev://tickets/{numeric_id}",
-        "timeline": f"devrev://tickets/{numeric_id}/timeline"
-    }
-    
-    return json.dumps(entry_data, indent=2)
+        # Short IDs cannot be fetched directly, so pick the entry out of the (usually
+        # cached) ticket timeline instead of returning the whole timeline
+        timeline_str = await timeline_resource(numeric_id, ctx, devrev_cache)
+        timeline_data = json.loads(timeline_str)
+        if is_error_response(timeline_data):
+            # Pass the timeline failure through
+            return timeline_str
+        entry = find_timeline_entry(timeline_data, numeric_id, entry_id)
+        if entry is None:
+            await ctx.error(f"Timeline entry {entry_id} not found on ticket {numeric_id}")
+            return create_error_response(
+                ResourceNotFoundError("timeline_entry", entry_id, {"timeline": f"devrev://tickets/{numeric_id}/timeline"}),
+                "timeline_entry",
+                entry_id
+            )
+        return json.dumps(entry, separators=(",", ":"))
+    
+    # The resource attaches this ticket's navigation links and caches the linked entry
+    return await timeline_entry_resource(entry_id, ctx, devrev_cache, ticket_number=numeric_id)
 
 @mcp.resource(
     uri="devrev://tickets/{ticket_number}/artifacts",
@@ -344,8 +369,8 @@ async def ticket_artifacts(ctx: Context, ticket_number: str = None, dev_org_id:
     Returns:
         JSON string containing artifacts with navigation links
     """
-    # Normalize to ticket number
-    numeric_id = ticket_number
+    # Normalize to ticket number; other IDs pass through for the handler to reject
+    numeric_id = parse_ticket_number(ticket_number) or ticket_number
     return await ticket_artifacts_resource(numeric_id, ctx, devrev_cache)
 
 @mcp.resource(
@@ -447,12 +472,22 @@ async def issue_timeline(ctx: Context, issue_id: str = None, issue_number: str =
     Returns:
         JSON string containing enriched timeline with internal context and conversation flow
     """
-    # Normalize to issue number
-    numeric_id = issue_id or issue_number
+    # Normalize to issue number; other IDs pass through for the handler to reject
+    raw_id = issue_id or issue_number
+    numeric_id = parse_issue_number(raw_id) or raw_id
+    
+    # Serve the already-encoded view on repeat reads instead of re-decoding the issue
+    cache_key = f"devrev://issues/{numeric_id}/timeline"
+    cached_value = devrev_cache.get(cache_key)
+    if cached_value is not None:
+        return cached_value
     
     # Get issue data to extract timeline
     issue_data_str = await issue_resource(numeric_id, ctx, devrev_cache)
     issue_data = json.loads(issue_data_str)
+    if is_error_response(issue_data):
+        # Pass the failure through without caching a view of it
+        return issue_data_str
     timeline_entries = issue_data.get("timeline_entries", [])
     
     # Build simplified timeline structure for issues
@@ -466,7 +501,9 @@ async def issue_timeline(ctx: Context, issue_id: str = None, issue_number: str =
         }
     }
     
-    return json.dumps(result, indent=2)
+    cache_value = json.dumps(result, separators=(",", ":"))
+    devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(numeric_id, "issue"))
+    return cache_value
 
 
 @mcp.resource(
@@ -489,21 +526,32 @@ async def issue_artifacts(ctx: Context, issue_id: str = None, issue_number: str
     Returns:
         JSON string containing artifacts with navigation links
     """
-    # Normalize to issue number
-    numeric_id = issue_id or issue_number
+    # Normalize to issue number; other IDs pass through for the handler to reject
+    raw_id = issue_id or issue_number
+    numeric_id = parse_issue_number(raw_id) or raw_id
+    
+    # Serve the already-encoded view on repeat reads instead of re-decoding the issue
+    cache_key = f"devrev://issues/{numeric_id}/artifacts"
+    cached_value = devrev_cache.get(cache_key)
+    if cached_value is not None:
+        return cached_value
     
     # Get issue data to extract artifacts
     issue_data_str = await issue_resource(numeric_id, ctx, devrev_cache)
     issue_data = json.loads(issue_data_str)
+    if is_error_response(issue_data):
+        # Pass the failure through without caching a view of it
+        return issue_data_str
     artifacts = issue_data.get("artifacts", [])
+    issue_uri = f"devrev://issues/{numeric_id}"  # Shared by every artifact's links
     
     # Add navigation links to each artifact
     for artifact in artifacts:
-        artifact_id = artifact.get("id", "").split("/")[-1] if artifact.get("id") else ""
+        artifact_id = (artifact.get("id") or "").rpartition("/")[2]
         if artifact_id:
             artifact["links"] = {
                 "self": f"devrev://artifacts/{artifact_id}",
-                "issue": f"devrev://issues/{numeric_id}"
+                "issue": issue_uri
             }
     
     result = {
@@ -515,7 +563,9 @@ async def issue_artifacts(ctx: Context, issue_id: str = None, issue_number: str
         }
     }
     
-    return json.dumps(result, indent=2)
+    cache_value = json.dumps(result, separators=(",", ":"))
+    devrev_cache.set(cache_key, cache_value, tag=work_item_cache_tag(numeric_id, "issue"))
+    return cache_value
 
 
 @mcp.tool(
@@ -638,7 +688,7 @@ async def create_timeline_comment(work_id: str, body: str, ctx: Context) -> str:
     Returns:
         JSON string containing the created timeline entry data
     """
-    return await create_timeline_comment_tool(work_id, body, ctx)
+    return await create_timeline_comment_tool(work_id, body, ctx, devrev_cache)
 
 # Core search resource patterns for URL-based access
 @mcp.resource(
@@ -711,6 +761,41 @@ async def search_resource(
     """
     return await core_search_tool(ctx, query, title, tag, type, status, namespace)
 
+@lru_cache(maxsize=1024)
+def _parse_object_id(object_id: str) -> Tuple[str, str, str]:
+    """
+    Classify a DevRev object ID, memoized since clients re-request the same IDs.
+    
+    Args:
+        object_id: DevRev object ID (TKT-12345, ISS-9031, numeric ID, or don:core format)
+    
+    Returns:
+        Tuple of (don:core work item ID, display ID, work item type)
+    
+    Raises:
+        ValueError: If the object ID format is not recognized
+    """
+    if object_id.startswith("TKT-"):
+        # The prefix is already known, so slice it off instead of scanning with replace()
+        return f"don:core:dvrv-us-1:devo/118WAPdKBc:ticket/{object_id[4:]}", object_id, "ticket"
+    if object_id.startswith("ISS-"):
+        return f"don:core:dvrv-us-1:devo/118WAPdKBc:issue/{object_id[4:]}", object_id, "issue"
+    if object_id.startswith("don:core:"):
+        # Full don:core format - extract type and display ID
+        parts = object_id.split(":")
+        if len(parts) >= 5 and "/" in parts[4]:
+            work_type, work_number = parts[4].split("/", 1)  # e.g., "ticket/12345"
+            if work_type == "ticket":
+                return object_id, f"TKT-{work_number}", work_type
+            if work_type == "issue":
+                return object_id, f"ISS-{work_number}", work_type
+            return object_id, f"{work_type.upper()}-{work_number}", work_type
+        return object_id, object_id, "unknown"
+    if object_id.isdigit():
+        # Assume numeric ticket ID
+        return f"don:core:dvrv-us-1:devo/118WAPdKBc:ticket/{object_id}", f"TKT-{object_id}", "ticket"
+    raise ValueError(f"Unsupported object ID format: {object_id}")
+
 # Links resource for fetching linked work items
 @mcp.resource(
     uri="devrev://links?object={object_id}",
@@ -728,44 +813,7 @@ async def links_resource(ctx: Context, object_id: str) -> str:
         JSON array of linked work items with navigation and metadata
     """
     # Parse object_id to determine work item details
-    if object_id.startswith("TKT-"):
-        work_item_display_id = object_id
-        work_item_type = "ticket"
-        numeric_id = object_id.replace("TKT-", "")
-        work_item_id = f"don:core:dvrv-us-1:devo/118WAPdKBc:ticket/{numeric_id}"
-    elif object_id.startswith("ISS-"):
-        work_item_display_id = object_id
-        work_item_type = "issue"
-        numeric_id = object_id.replace("ISS-", "")
-        work_item_id = f"don:core:dvrv-us-1:devo/118WAPdKBc:issue/{numeric_id}"
-    elif object_id.startswith("don:core:"):
-        # Full don:core format - extract type and display ID
-        work_item_id = object_id
-        parts = object_id.split(":")
-        if len(parts) >= 5:
-            work_type_part = parts[4]  # e.g., "ticket/12345"
-            if "/" in work_type_part:
-                work_type, work_number = work_type_part.split("/", 1)
-                work_item_type = work_type
-                if work_type == "ticket":
-                    work_item_display_id = f"TKT-{work_number}"
-                elif work_type == "issue":
-                    work_item_display_id = f"ISS-{work_number}"
-                else:
-                    work_item_display_id = f"{work_type.upper()}-{work_number}"
-            else:
-                work_item_type = "unknown"
-                work_item_display_id = object_id
-        else:
-            work_item_type = "unknown"
-            work_item_display_id = object_id
-    elif object_id.isdigit():
-        # Assume numeric ticket ID
-        work_item_display_id = f"TKT-{object_id}"
-        work_item_type = "ticket"
-        work_item_id = f"don:core:dvrv-us-1:devo/118WAPdKBc:ticket/{object_id}"
-    else:
-        raise ValueError(f"Unsupported object ID format: {object_id}")
+    work_item_id, work_item_display_id, work_item_type = _parse_object_id(object_id)
     
     # Fetch linked work items using the existing utility
     linked_items = await fetch_linked_work_items(
@@ -777,12 +825,73 @@ async def links_resource(ctx: Context, object_id: str) -> str:
     )
     
     # Return the raw list as JSON - preserves the existing contract
-    return json.dumps(linked_items, indent=2)
+    return json.dumps(linked_items, separators=(",", ":"))
+
+@mcp.resource(
+    uri="devrev://diagnostics/cache",
+    tags=DIAGNOSTICS_RESOURCE_TAGS
+)
+async def cache_diagnostics() -> str:
+    """
+    Inspect the server's response cache: entry and byte usage against their limits, and hit/miss counts.
+    
+    Returns:
+        JSON string containing cache statistics
+    """
+    return json.dumps(devrev_cache.stats(), separators=(",", ":"))
+
+class _PrefetchContext:
+    """Stand-in for the FastMCP Context while warming the cache outside any client request."""
+    
+    async def info(self, message: str) -> None:
+        pass
+    
+    async def warning(self, message: str) -> None:
+        pass
+    
+    async def error(self, message: str) -> None:
+        pass
+
+# Upper bound on the whole startup warm-up, in seconds
+PREFETCH_TIMEOUT = 30
+
+async def _prefetch_tickets(ticket_ids: List[str]) -> None:
+    """
+    Warm devrev_cache with the work item and timeline views of each listed ticket.
+    
+    Failures are ignored, and the warm-up gives up after PREFETCH_TIMEOUT seconds;
+    an unfetched ticket is simply loaded on first use.
+    
+    Args:
+        ticket_ids: Ticket IDs from DEVREV_PREFETCH_IDS
+    """
+    ticket_numbers = []
+    for ticket_id in ticket_ids:
+        number = parse_ticket_number(ticket_id.strip())
+        if number:
+            ticket_numbers.append(number)
+    if not ticket_numbers:
+        return
+    
+    ctx = _PrefetchContext()
+    warm = asyncio.gather(
+        *(work_resource(f"TKT-{number}", ctx, devrev_cache) for number in ticket_numbers),
+        *(timeline_resource(number, ctx, devrev_cache) for number in ticket_numbers),
+        return_exceptions=True
+    )
+    try:
+        await asyncio.wait_for(warm, timeout=PREFETCH_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass
 
 def main():
     """Main entry point for the DevRev MCP server."""
-    # Run the server
-    mcp.run()
+    try:
+        # Run the server; DEVREV_PREFETCH_IDS are warmed by _prefetch_lifespan
+        mcp.run()
+    finally:
+        # Release pooled keep-alive connections to the DevRev API
+        SessionManager().close_session()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,7 +9,7 @@ import json
 from typing import Dict, Any, List, Optional
 from fastmcp import Context
 
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, INFO_LOGGING_ENABLED
 from ..error_handler import tool_error_handler
 from ..endpoints import SEARCH_CORE
 
@@ -62,19 +62,21 @@ async def core_search(
     try:
         # Log the search parameters for debugging
         param_summary = ", ".join([f"{k}={v}" for k, v in search_params.items()])
-        await ctx.info(f"Core search with parameters: {param_summary}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Core search with parameters: {param_summary}")
         
-        response = make_devrev_request(SEARCH_CORE, search_params)
+        response = await make_devrev_request_async(SEARCH_CORE, search_params)
         
         if response.status_code != 200:
             error_text = response.text
             await ctx.error(f"Core search failed with status {response.status_code}: {error_text}")
             raise ValueError(f"Core search failed with status {response.status_code}: {error_text}")
         
-        search_results = response.json()
+        search_results = parse_json_response(response)
         parsed_results = _parse_core_search_results(search_results, search_params)
         
-        await ctx.info(f"Core search completed successfully with {len(parsed_results.get('results', []))} results")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Core search completed successfully with {len(parsed_results.get('results', []))} results")
         
         return json.dumps(parsed_results, indent=2)
     
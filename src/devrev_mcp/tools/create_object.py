@@ -6,7 +6,7 @@ Creates new issues or tickets in DevRev.
 
 import json
 from fastmcp import Context
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, INFO_LOGGING_ENABLED
 from ..error_handler import tool_error_handler
 from ..endpoints import WORKS_CREATE
 
@@ -38,7 +38,8 @@ async def create_object(
         raise ValueError(f"Invalid type '{type}'. Must be 'issue' or 'ticket'")
     
     try:
-        await ctx.info(f"Creating new {type}: {title}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Creating new {type}: {title}")
         
         payload = {
             "type": type,
@@ -51,15 +52,16 @@ async def create_object(
         if owned_by:
             payload["owned_by"] = owned_by
         
-        response = make_devrev_request(WORKS_CREATE, payload)
+        response = await make_devrev_request_async(WORKS_CREATE, payload)
         
         if response.status_code != 200:
             error_text = response.text
             await ctx.error(f"Failed to create {type}: HTTP {response.status_code} - {error_text}")
             raise ValueError(f"Failed to create {type} (HTTP {response.status_code}): {error_text}")
         
-        result_data = response.json()
-        await ctx.info(f"Successfully created {type} with ID: {result_data.get('work', {}).get('id', 'unknown')}")
+        result_data = parse_json_response(response)
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Successfully created {type} with ID: {result_data.get('work', {}).get('id', 'unknown')}")
         
         return json.dumps(result_data, indent=2)
         
@@ -8,14 +8,16 @@ import json
 from fastmcp import Context
 from ..error_handler import tool_error_handler
 from ..endpoints import TIMELINE_ENTRIES_CREATE
-from ..utils import make_devrev_request, read_resource_content
+from ..utils import make_devrev_request_async, parse_json_response, read_resource_content, invalidate_work_item, INFO_LOGGING_ENABLED
+from ..cache import SimpleCache
 
 
 @tool_error_handler("create_timeline_comment")
 async def create_timeline_comment(
     work_id: str,
     body: str,
-    ctx: Context
+    ctx: Context,
+    devrev_cache: SimpleCache | None = None
 ) -> str:
     """
     Create an internal timeline comment on a DevRev ticket or issue.
@@ -24,21 +26,25 @@ async def create_timeline_comment(
         work_id: The DevRev work item ID (e.g., "12345", "TKT-12345", "ISS-9465")
         body: The comment text to add to the timeline
         ctx: FastMCP context
+        devrev_cache: Cache for invalidating the work item's cached timeline
     
     Returns:
         JSON string containing the created timeline entry data
     """
     try:
-        await ctx.info(f"Creating timeline comment on work item {work_id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Creating timeline comment on work item {work_id}")
         
         resource_uri = f"devrev://works/{work_id}"
-        await ctx.info(f"Constructed resource URI: {resource_uri}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Constructed resource URI: {resource_uri}")
         
         try:
             work_item = await read_resource_content(ctx, resource_uri, parse_json=True)
-            await ctx.info(f"Successfully retrieved work item. Keys: {list(work_item.keys()) if work_item else 'None'}")
-            await ctx.info(f"Work item type: {type(work_item)}")
-            if work_item:
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Successfully retrieved work item. Keys: {list(work_item.keys()) if work_item else 'None'}")
+                await ctx.info(f"Work item type: {type(work_item)}")
+            if INFO_LOGGING_ENABLED and work_item:
                 await ctx.info(f"Work item sample: {json.dumps(dict(list(work_item.items())[:5]), indent=2)}")
         except Exception as e:
             await ctx.error(f"Failed to read resource content for {resource_uri}: {str(e)}")
@@ -50,19 +56,23 @@ async def create_timeline_comment(
             ]
             for alt_uri in alternative_uris:
                 try:
-                    await ctx.info(f"Trying alternative URI: {alt_uri}")
+                    if INFO_LOGGING_ENABLED:
+                        await ctx.info(f"Trying alternative URI: {alt_uri}")
                     work_item = await read_resource_content(ctx, alt_uri, parse_json=True)
-                    await ctx.info(f"Success with alternative URI: {alt_uri}")
+                    if INFO_LOGGING_ENABLED:
+                        await ctx.info(f"Success with alternative URI: {alt_uri}")
                     break
                 except Exception as alt_e:
-                    await ctx.info(f"Alternative URI {alt_uri} failed: {str(alt_e)}")
+                    if INFO_LOGGING_ENABLED:
+                        await ctx.info(f"Alternative URI {alt_uri} failed: {str(alt_e)}")
             else:
                 raise e
         
         # Extract the object ID from the work item - this should be the full don:core ID
         object_id = work_item.get("id")
-        await ctx.info(f"Raw object_id extracted: {object_id}")
-        await ctx.info(f"Object ID type: {type(object_id)}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Raw object_id extracted: {object_id}")
+            await ctx.info(f"Object ID type: {type(object_id)}")
         
         if not object_id:
             await ctx.error(f"Work item: {work_item}")
@@ -70,7 +80,8 @@ async def create_timeline_comment(
 
 
         
-        await ctx.info(f"Using object ID: {object_id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Using object ID: {object_id}")
         
         # Prepare the payload for timeline comment creation using the full object ID
         payload = {
@@ -82,14 +93,20 @@ async def create_timeline_comment(
             "visibility": "internal"
         }
         
-        await ctx.info(f"Creating comment with payload: {json.dumps(payload, indent=2)}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Creating comment with payload: {json.dumps(payload, indent=2)}")
         
         # Make the API request
-        response = make_devrev_request(TIMELINE_ENTRIES_CREATE, payload)
+        response = await make_devrev_request_async(TIMELINE_ENTRIES_CREATE, payload)
         
         if response.status_code == 200 or response.status_code == 201:
-            result_data = response.json()
-            await ctx.info(f"Successfully created timeline comment on work item {work_id}")
+            result_data = parse_json_response(response)
+            # The cached timeline (and views built from it) no longer include this comment
+            if devrev_cache:
+                invalidate_work_item(devrev_cache, work_id)
+                invalidate_work_item(devrev_cache, object_id)
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Successfully created timeline comment on work item {work_id}")
             return json.dumps(result_data, indent=2)
         else:
             error_msg = f"Failed to create timeline comment: HTTP {response.status_code}"
@@ -8,8 +8,9 @@ import json
 import os
 import requests
 from pathlib import Path
+from urllib.parse import urlparse
 from fastmcp import Context
-from ..utils import read_resource_content
+from ..utils import read_resource_content, INFO_LOGGING_ENABLED
 from ..error_handler import tool_error_handler
 
 
@@ -27,7 +28,8 @@ async def download_artifact(artifact_id: str, download_directory: str, ctx: Cont
         JSON string containing download result information
     """
     try:
-        await ctx.info(f"Starting download of artifact {artifact_id} to {download_directory}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Starting download of artifact {artifact_id} to {download_directory}")
         
         # Ensure download directory exists
         os.makedirs(download_directory, exist_ok=True)
@@ -37,7 +39,8 @@ async def download_artifact(artifact_id: str, download_directory: str, ctx: Cont
         artifact_data = await read_resource_content(ctx, resource_uri, parse_json=True)
         artifact_info = artifact_data.get("artifact", {})
         
-        await ctx.info(f"Retrieved artifact metadata: {artifact_info.get('display_id', artifact_id)}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Retrieved artifact metadata: {artifact_info.get('display_id', artifact_id)}")
         
         # Check if download URL is available in the artifact data
         download_url = None
@@ -67,7 +70,6 @@ async def download_artifact(artifact_id: str, download_directory: str, ctx: Cont
         filename = file_info.get("name") or file_info.get("filename")
         if not filename:
             # Extract from URL as fallback
-            from urllib.parse import urlparse
             parsed_url = urlparse(download_url)
             filename = os.path.basename(parsed_url.path)
         if not filename:
@@ -79,7 +81,8 @@ async def download_artifact(artifact_id: str, download_directory: str, ctx: Cont
         # Download the file
         download_path = Path(download_directory) / filename
         
-        await ctx.info(f"Downloading artifact from {download_url} to {download_path}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Downloading artifact from {download_url} to {download_path}")
         
         # Download with streaming to handle large files
         with requests.get(download_url, stream=True, timeout=60) as response:
@@ -106,7 +109,8 @@ async def download_artifact(artifact_id: str, download_directory: str, ctx: Cont
             }
         }
         
-        await ctx.info(f"Successfully downloaded artifact {artifact_id} ({file_size} bytes) to {download_path}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Successfully downloaded artifact {artifact_id} ({file_size} bytes) to {download_path}")
         return json.dumps(result, indent=2)
         
     except requests.RequestException as e:
@@ -7,7 +7,7 @@ Provides a tool for fetching DevRev tickets with enriched timeline entries and a
 import json
 from fastmcp import Context
 from ..error_handler import tool_error_handler
-from ..utils import read_resource_content
+from ..utils import read_resource_content, INFO_LOGGING_ENABLED
 
 
 @tool_error_handler("get_ticket")
@@ -30,7 +30,8 @@ async def get_ticket(
         raise ValueError("ID parameter is required and cannot be empty")
     
     try:
-        await ctx.info(f"Fetching work item {id} with timeline entries and artifacts")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching work item {id} with timeline entries and artifacts")
         
         # Use different resource depending on ID format
         if id.upper().startswith("TKT-"):
@@ -94,7 +95,8 @@ async def get_ticket(
         if "timeline_entries" in ticket_data:
             del ticket_data["timeline_entries"]
         
-        await ctx.info(f"Returning core ticket data for {id} with navigation links")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Returning core ticket data for {id} with navigation links")
         return json.dumps(ticket_data, indent=2)
 
     except Exception as e:
@@ -8,7 +8,7 @@ import json
 from fastmcp import Context
 from ..types import VisibilityInfo, TimelineEntryType
 from ..error_handler import tool_error_handler
-from ..utils import read_resource_content
+from ..utils import read_resource_content, INFO_LOGGING_ENABLED
 
 
 @tool_error_handler("get_timeline_entries")
@@ -40,7 +40,8 @@ async def get_timeline_entries(
         raise ValueError(f"Invalid format '{format}'. Must be one of: summary, detailed, full")
     
     try:
-        await ctx.info(f"Fetching timeline entries for {id} in {format} format")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching timeline entries for {id} in {format} format")
         
         # Try different resource URIs and let pattern matching handle the ID format
         resource_uris = [
@@ -70,7 +71,7 @@ async def get_timeline_entries(
             return _format_detailed(timeline_data, id)
         else:  # format == "full"
             try:
-                return json.dumps(timeline_data, indent=2, default=str)
+                return json.dumps(timeline_data, indent=2)
             except (TypeError, ValueError) as e:
                 await ctx.error(f"Could not serialize timeline data to JSON: {str(e)}")
                 return str(timeline_data)
@@ -179,8 +180,7 @@ def _format_detailed(timeline_data, display_id: str) -> str:
             for i, artifact in enumerate(artifacts, 1):
                 artifact_id = artifact.get("id", "Unknown ID")
                 # Extract just the artifact ID from the full don:core format if present
-                if "/" in str(artifact_id):
-                    artifact_id = str(artifact_id).split("/")[-1]
+                artifact_id = str(artifact_id).rpartition("/")[2]
                 
                 filename = artifact.get("file", {}).get("name", "Unknown filename")
                 file_size = artifact.get("file", {}).get("size")
@@ -6,7 +6,7 @@ Provides a tool for fetching any DevRev work item (tickets, issues, etc.) by ID.
 
 import json
 from fastmcp import Context
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, INFO_LOGGING_ENABLED
 from ..endpoints import WORKS_GET
 from ..error_handler import tool_error_handler
 
@@ -24,14 +24,15 @@ async def get_work(id: str, ctx: Context) -> str:
         JSON string containing the work item data
     """
     try:
-        await ctx.info(f"Fetching work item {id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Fetching work item {id}")
         
         # Make API request to get work item details using works.get
         payload = {
             "id": id
         }
         
-        response = make_devrev_request(WORKS_GET, payload)
+        response = await make_devrev_request_async(WORKS_GET, payload)
         
         if response.status_code != 200:
             await ctx.error(f"DevRev API returned status {response.status_code}")
@@ -41,7 +42,7 @@ async def get_work(id: str, ctx: Context) -> str:
                 "message": response.text
             })
         
-        data = response.json()
+        data = parse_json_response(response)
         work_item = data.get("work")
         
         if not work_item:
@@ -51,7 +52,7 @@ async def get_work(id: str, ctx: Context) -> str:
             })
         
         # Return the work item data directly
-        return json.dumps(work_item, indent=2, default=str)
+        return json.dumps(work_item, indent=2)
             
     except Exception as e:
         await ctx.error(f"Failed to get work item {id}: {str(e)}")
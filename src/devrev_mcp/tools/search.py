@@ -9,7 +9,7 @@ import json
 from typing import Dict, Any, List
 from fastmcp import Context
 
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, INFO_LOGGING_ENABLED
 from ..error_handler import tool_error_handler
 from ..endpoints import SEARCH_HYBRID
 
@@ -31,9 +31,10 @@ async def search(query: str, namespace: str, ctx: Context) -> str:
         raise ValueError(f"Invalid namespace '{namespace}'. Must be one of: article, issue, ticket, part, dev_user")
     
     try:
-        await ctx.info(f"Searching DevRev for '{query}' in namespace '{namespace}'")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Searching DevRev for '{query}' in namespace '{namespace}'")
         
-        response = make_devrev_request(
+        response = await make_devrev_request_async(
             SEARCH_HYBRID,
             {"query": query, "namespace": namespace}
         )
@@ -43,10 +44,11 @@ async def search(query: str, namespace: str, ctx: Context) -> str:
             await ctx.error(f"Search failed with status {response.status_code}: {error_text}")
             raise ValueError(f"Search failed with status {response.status_code}: {error_text}")
         
-        search_results = response.json()
+        search_results = parse_json_response(response)
         parsed_results = _parse_search_results(search_results, namespace)
         
-        await ctx.info(f"Search completed successfully with {len(parsed_results.get('results', []))} results")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Search completed successfully with {len(parsed_results.get('results', []))} results")
         
         return json.dumps(parsed_results, indent=2)
     
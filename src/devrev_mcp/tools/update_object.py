@@ -6,9 +6,10 @@ Updates existing issues or tickets in DevRev.
 
 import json
 from fastmcp import Context
-from ..utils import make_devrev_request
+from ..utils import make_devrev_request_async, parse_json_response, invalidate_work_item, INFO_LOGGING_ENABLED
 from ..error_handler import tool_error_handler
 from ..endpoints import WORKS_UPDATE
+from ..cache import SimpleCache
 
 
 @tool_error_handler("update_object")
@@ -16,7 +17,7 @@ async def update_object(
     id: str,
     type: str,
     ctx: Context,
-    devrev_cache: dict | None = None,
+    devrev_cache: SimpleCache | None = None,
     title: str | None = None,
     body: str | None = None
 ) -> str:
@@ -29,7 +30,7 @@ async def update_object(
         title: New title for the object (optional)
         body: New body/description for the object (optional)
         ctx: FastMCP context
-        devrev_cache: Cache dictionary for invalidating cached results
+        devrev_cache: Cache for invalidating cached results
     
     Returns:
         JSON string containing the updated object information
@@ -41,7 +42,8 @@ async def update_object(
         raise ValueError("At least one of 'title' or 'body' must be provided for update")
     
     try:
-        await ctx.info(f"Updating {type} {id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Updating {type} {id}")
         
         payload = {
             "id": id,
@@ -53,21 +55,23 @@ async def update_object(
         if body:
             payload["body"] = body
         
-        response = make_devrev_request(WORKS_UPDATE, payload)
+        response = await make_devrev_request_async(WORKS_UPDATE, payload)
         
         if response.status_code != 200:
             error_text = response.text
             await ctx.error(f"Failed to update {type}: HTTP {response.status_code} - {error_text}")
             raise ValueError(f"Failed to update {type} (HTTP {response.status_code}): {error_text}")
         
-        result_data = response.json()
+        result_data = parse_json_response(response)
         
-        # Update cache if we have this object cached
+        # Drop every cached view of this object so the next read sees the update
         if devrev_cache:
-            devrev_cache.delete(id)
-            await ctx.info(f"Cleared cache for updated object: {id}")
+            invalidate_work_item(devrev_cache, id, type)
+            if INFO_LOGGING_ENABLED:
+                await ctx.info(f"Cleared cache for updated object: {id}")
         
-        await ctx.info(f"Successfully updated {type}: {id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Successfully updated {type}: {id}")
         return json.dumps(result_data, indent=2)
         
     except Exception as e:
@@ -6,7 +6,8 @@ to improve model understanding and provide clear documentation.
 """
 
 from enum import Enum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional
 from dataclasses import dataclass
 
 
@@ -58,10 +59,12 @@ class TimelineEntryVisibility(Enum):
         return visibility in [cls.PRIVATE.value, cls.INTERNAL.value]
 
 
-@dataclass
+@dataclass(frozen=True)
 class VisibilityInfo:
     """
     Container for visibility information with helpful context.
+    
+    Instances are immutable because from_visibility shares one per visibility level.
     """
     level: str
     description: str
@@ -70,8 +73,9 @@ class VisibilityInfo:
     internal_only: bool
     
     @classmethod
+    @lru_cache(maxsize=16)
     def from_visibility(cls, visibility: Optional[str]) -> 'VisibilityInfo':
-        """Create VisibilityInfo from a visibility string."""
+        """Create VisibilityInfo from a visibility string, memoized per distinct value."""
         # Default to EXTERNAL if not specified
         vis_level = visibility or TimelineEntryVisibility.EXTERNAL.value
         
@@ -120,12 +124,13 @@ class TimelineEntryType(Enum):
         ]
 
 
-def format_visibility_summary(entries_with_visibility: list) -> Dict[str, Any]:
+def format_visibility_summary(entries_with_visibility: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Generate a summary of visibility levels across timeline entries.
     
     Args:
-        entries_with_visibility: List of timeline entries with visibility info
+        entries_with_visibility: Timeline entries with visibility info; any iterable,
+            so callers can chain several lists without concatenating them
         
     Returns:
         Dictionary with visibility statistics and breakdown
@@ -133,8 +138,10 @@ def format_visibility_summary(entries_with_visibility: list) -> Dict[str, Any]:
     visibility_counts = {}
     customer_visible_count = 0
     internal_only_count = 0
+    total_entries = 0
     
     for entry in entries_with_visibility:
+        total_entries += 1
         visibility = entry.get("visibility_info", {})
         level = visibility.get("level", "external")
         
@@ -145,8 +152,6 @@ def format_visibility_summary(entries_with_visibility: list) -> Dict[str, Any]:
         if visibility.get("internal_only", False):
             internal_only_count += 1
     
-    total_entries = len(entries_with_visibility)
-    
     return {
         "total_entries": total_entries,
         "visibility_breakdown": visibility_counts,
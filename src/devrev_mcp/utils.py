@@ -5,11 +5,21 @@ SPDX-License-Identifier: MIT
 This module provides utility functions for making authenticated requests to the DevRev API.
 """
 
+import asyncio
 import json
 import os
+import re
 import requests
+from functools import wraps
 from typing import Any, Dict, List, Union
 from fastmcp import Context
+from .cache import SimpleCache
+from .endpoints import LINK_TYPES_LIST, LINKS_LIST
+from .error_handler import APIError
+
+# Informational ctx.info messages are opt-in so hot paths skip formatting and
+# awaiting them; warnings and errors are always sent
+INFO_LOGGING_ENABLED = os.environ.get("DEVREV_MCP_LOG_INFO", "").lower() in ("1", "true", "yes")
 
 class SessionManager:
     """Singleton session manager for connection pooling and lifecycle management."""
@@ -26,11 +36,13 @@ class SessionManager:
         """Get or create a shared requests session for connection pooling."""
         if self._session is None:
             self._session = requests.Session()
-            # Configure session for optimal performance
+            # Configure session for optimal performance; requests beyond pool_maxsize
+            # wait for a pooled connection instead of opening throwaway ones
             adapter = requests.adapters.HTTPAdapter(
                 pool_connections=10,
                 pool_maxsize=20,
-                max_retries=3
+                max_retries=3,
+                pool_block=True
             )
             self._session.mount('https://', adapter)
             self._session.mount('http://', adapter)
@@ -81,19 +93,170 @@ def make_devrev_request(endpoint: str, payload: Dict[str, Any]) -> requests.Resp
         )
         return response
     except requests.Timeout as e:
-        from .error_handler import APIError
         raise APIError(endpoint, 408, "Request timeout after 30 seconds") from e
     except requests.ConnectionError as e:
-        from .error_handler import APIError
         raise APIError(endpoint, 503, f"Connection failed: {str(e)}") from e
     except requests.HTTPError as e:
-        from .error_handler import APIError
         raise APIError(endpoint, getattr(e.response, 'status_code', 500), f"HTTP error: {str(e)}") from e
     except requests.RequestException as e:
-        from .error_handler import APIError
         raise APIError(endpoint, 500, f"Request failed: {str(e)}") from e
 
 
+async def make_devrev_request_async(endpoint: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    Make an authenticated request to the DevRev API without blocking the event loop.
+    
+    Runs make_devrev_request on a worker thread so independent calls can be
+    awaited concurrently (e.g. with asyncio.gather) over the pooled session.
+    
+    Args:
+        endpoint: The API endpoint path (use constants from endpoints.py)
+        payload: The JSON payload to send
+    
+    Returns:
+        requests.Response object
+    """
+    return await asyncio.to_thread(make_devrev_request, endpoint, payload)
+
+
+def single_flight(func):
+    """
+    Decorator that shares one in-flight call among concurrent callers for the same ID.
+    
+    Callers that arrive while a call with the same first argument is still running
+    await that call instead of repeating its API requests. Nothing is kept once the
+    call finishes; caching the result remains the handler's job.
+    
+    Not safe for handlers that can re-enter themselves with the same ID, since the
+    inner call would wait on the outer one.
+    """
+    inflight: Dict[str, asyncio.Future] = {}
+    
+    @wraps(func)
+    async def wrapper(resource_id, *args, **kwargs):
+        pending = inflight.get(resource_id)
+        if pending is None:
+            pending = asyncio.ensure_future(func(resource_id, *args, **kwargs))
+            inflight[resource_id] = pending
+            pending.add_done_callback(lambda _: inflight.pop(resource_id, None))
+        # Shield so one caller being cancelled does not cancel the shared call
+        return await asyncio.shield(pending)
+    
+    return wrapper
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """
+    Parse a DevRev API response body as JSON.
+    
+    Decodes the raw body bytes directly, skipping the encoding detection and
+    intermediate text decoding that response.json() goes through.
+    
+    Args:
+        response: requests.Response object returned by make_devrev_request
+    
+    Returns:
+        The parsed JSON value
+    """
+    return json.loads(response.content)
+
+
+# Bare numbers or display IDs (e.g. "12345" or "TKT-12345", "9031" or "ISS-9031")
+_TICKET_NUMBER_RE = re.compile(r"(?i)^(?:TKT-)?(\d+)$")
+_ISSUE_NUMBER_RE = re.compile(r"(?i)^(?:ISS-)?(\d+)$")
+# don:core IDs ending in ticket/<n> or issue/<n>
+_WORK_DON_ID_RE = re.compile(r":(ticket|issue)/(\d+)$")
+
+
+def parse_ticket_number(ticket_id: str) -> str | None:
+    """Number of a ticket given as "12345" or "TKT-12345", or None for any other ID."""
+    match = _TICKET_NUMBER_RE.match(ticket_id)
+    return match.group(1) if match else None
+
+
+def parse_issue_number(issue_id: str) -> str | None:
+    """Number of an issue given as "9031" or "ISS-9031", or None for any other ID."""
+    match = _ISSUE_NUMBER_RE.match(issue_id)
+    return match.group(1) if match else None
+
+
+def work_item_cache_tag(work_id: str, work_type: str | None = None) -> str | None:
+    """
+    Cache tag shared by every cached view of a ticket or issue.
+    
+    Args:
+        work_id: Display ID, bare number, or don:core ID of the work item
+        work_type: "ticket" or "issue", used when work_id is a bare number
+    
+    Returns:
+        Tag such as "ticket:12345" or "issue:9031", or None for other IDs
+    """
+    # A display ID prefix decides the type; the hint only applies to bare numbers
+    prefix = work_id[:4].upper()
+    if prefix == "TKT-":
+        work_type = "ticket"
+    elif prefix == "ISS-":
+        work_type = "issue"
+    number = parse_issue_number(work_id) if work_type == "issue" else parse_ticket_number(work_id)
+    if number is None:
+        match = _WORK_DON_ID_RE.search(work_id)
+        if not match:
+            return None
+        work_type, number = match.groups()
+    
+    return f"issue:{number}" if work_type == "issue" else f"ticket:{number}"
+
+
+def invalidate_work_item(cache: SimpleCache, work_id: str, work_type: str | None = None) -> None:
+    """
+    Drop every cached view of a work item after it has been changed.
+    
+    Resource handlers tag what they cache with work_item_cache_tag(), so the
+    ticket/issue, timeline, timeline entry, artifacts and works views all go
+    together whatever ID form they were read through.
+    
+    Args:
+        cache: Cache the resource handlers store their results in
+        work_id: Display ID, bare number, or don:core ID of the changed work item
+        work_type: "ticket" or "issue", used when work_id is a bare number
+    """
+    # Not-found results are cached untagged under the ID they were requested with
+    cache.delete(f"work_{work_id}")
+    
+    tag = work_item_cache_tag(work_id, work_type)
+    if tag is not None:
+        cache.delete_tag(tag)
+
+
+def append_json_field(payload: str, key: str, value: Any) -> str:
+    """
+    Add a top-level field to an already-encoded JSON object.
+    
+    Splices the encoded field in before the closing brace so that a large
+    upstream body does not have to be re-encoded just to attach a small value.
+    The caller must ensure the object does not already contain the key.
+    
+    Args:
+        payload: Encoded JSON object
+        key: Field name to add
+        value: JSON-serializable field value
+    
+    Returns:
+        The encoded object with the field appended
+    
+    Raises:
+        ValueError: If payload is not an encoded JSON object
+    """
+    body = payload.rstrip()
+    if not body.startswith("{") or not body.endswith("}"):
+        raise ValueError("Payload is not an encoded JSON object")
+    
+    head = body[:-1].rstrip()
+    separator = "" if head == "{" else ","
+    field = json.dumps(key) + ":" + json.dumps(value, separators=(",", ":"))
+    return head + separator + field + "}"
+
+
 
 async def read_resource_content(
     ctx: Context, 
@@ -124,7 +287,8 @@ async def read_resource_content(
         Exception: If reading the resource fails
     """
     try:
-        await ctx.info(f"Reading resource: {resource_uri}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Reading resource: {resource_uri}")
         resource_result = await ctx.read_resource(resource_uri)
         
         # Extract content following the established pattern
@@ -136,7 +300,7 @@ async def read_resource_content(
                 if hasattr(content_item, 'content'):
                     try:
                         content_data = content_item.content
-                        if i > 0:
+                        if INFO_LOGGING_ENABLED and i > 0:
                             await ctx.info(f"Successfully got content from item {i}")
                         break
                     except Exception as e:
@@ -164,7 +328,8 @@ async def read_resource_content(
         if parse_json:
             try:
                 parsed_data = json.loads(content_data)
-                await ctx.info(f"Successfully parsed JSON from resource {resource_uri}")
+                if INFO_LOGGING_ENABLED:
+                    await ctx.info(f"Successfully parsed JSON from resource {resource_uri}")
                 return parsed_data
             except json.JSONDecodeError as e:
                 await ctx.error(f"Failed to parse JSON from resource {resource_uri}: {e}")
@@ -180,7 +345,7 @@ async def read_resource_content(
         raise
 
 
-async def get_link_types(ctx: Context, cache: dict) -> Dict[str, Dict[str, str]]:
+async def get_link_types(ctx: Context, cache: SimpleCache) -> Dict[str, Dict[str, str]]:
     """
     Fetch and cache link types from DevRev API.
     
@@ -191,18 +356,17 @@ async def get_link_types(ctx: Context, cache: dict) -> Dict[str, Dict[str, str]]
     cached_value = cache.get(cache_key)
     
     if cached_value is not None:
-        return cached_value
-    
-    from .endpoints import LINK_TYPES_LIST  # Import here to avoid circular imports
+        # SimpleCache stores dicts as JSON text
+        return json.loads(cached_value)
     
     try:
-        response = make_devrev_request(LINK_TYPES_LIST, {})
+        response = await make_devrev_request_async(LINK_TYPES_LIST, {})
         
         if response.status_code != 200:
             await ctx.warning(f"Could not fetch link types: HTTP {response.status_code}")
             return {}
             
-        data = response.json()
+        data = parse_json_response(response)
         link_types = data.get("link_types", [])
         
         # Build lookup dictionary
@@ -219,7 +383,8 @@ async def get_link_types(ctx: Context, cache: dict) -> Dict[str, Dict[str, str]]
                 }
         
         cache.set(cache_key, link_type_map)
-        await ctx.info(f"Cached {len(link_type_map)} link types")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Cached {len(link_type_map)} link types")
         return link_type_map
         
     except Exception as e:
@@ -232,7 +397,7 @@ async def fetch_linked_work_items(
     work_item_display_id: str,
     work_item_type: str,
     ctx: Context,
-    cache: dict = None
+    cache: SimpleCache | None = None
 ) -> List[Dict[str, Any]]:
     """
     Fetch and process linked work items for any DevRev work item.
@@ -245,20 +410,18 @@ async def fetch_linked_work_items(
         work_item_display_id: The display ID of the work item (e.g., "TKT-12345", "ISS-9031")  
         work_item_type: The type of work item ("ticket", "issue", etc.)
         ctx: FastMCP context for logging
-        cache: Cache dictionary for storing link types
+        cache: Cache for storing link types
     
     Returns:
         List of linked work items with navigation links and metadata
     """
-    from .endpoints import LINKS_LIST  # Import here to avoid circular imports
-    
     # Get link types for better relationship descriptions
     link_types_map = {}
     if cache is not None:
         link_types_map = await get_link_types(ctx, cache)
     
     try:
-        links_response = make_devrev_request(
+        links_response = await make_devrev_request_async(
             LINKS_LIST,
             {"object": work_item_id}
         )
@@ -267,7 +430,7 @@ async def fetch_linked_work_items(
             await ctx.warning(f"Could not fetch links for {work_item_type} {work_item_display_id}")
             return []
             
-        links_data = links_response.json()
+        links_data = parse_json_response(links_response)
         links = links_data.get("links", [])
         
         # Process links to extract linked work items
@@ -345,7 +508,8 @@ async def fetch_linked_work_items(
                     if not existing_item:
                         linked_work_items.append(processed_item)
         
-        await ctx.info(f"Added {len(linked_work_items)} linked work items to {work_item_type} {work_item_display_id}")
+        if INFO_LOGGING_ENABLED:
+            await ctx.info(f"Added {len(linked_work_items)} linked work items to {work_item_type} {work_item_display_id}")
         return linked_work_items
         
     except Exception as e:
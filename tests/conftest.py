@@ -0,0 +1,111 @@
+"""
+Shared fixtures: an in-memory DevRev API and a fresh response cache per test.
+"""
+
+import json
+
+import pytest
+
+import devrev_mcp.cache as cache_module
+import devrev_mcp.server as server
+import devrev_mcp.utils as utils
+from devrev_mcp.cache import SimpleCache, DEFAULT_CACHE_TTL
+from devrev_mcp.endpoints import (
+    WORKS_GET,
+    WORKS_UPDATE,
+    TIMELINE_ENTRIES_LIST,
+    TIMELINE_ENTRIES_GET,
+    TIMELINE_ENTRIES_CREATE,
+    LINKS_LIST,
+    LINK_TYPES_LIST,
+)
+
+DON_PREFIX = "don:core:dvrv-us-1:devo/1"
+TICKET_DON_ID = f"{DON_PREFIX}:ticket/5"
+ISSUE_DON_ID = f"{DON_PREFIX}:issue/7"
+ENTRY_DON_ID = f"{TICKET_DON_ID}/timeline_event/e1"
+
+
+class FakeResponse:
+    """Just enough of requests.Response for the handlers."""
+
+    def __init__(self, data, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(data).encode("utf-8")
+        self.text = self.content.decode("utf-8")
+
+
+class FakeDevRev:
+    """In-memory DevRev API holding one ticket (TKT-5) and one issue (ISS-7)."""
+
+    def __init__(self):
+        self.titles = {"ticket": "Original ticket", "issue": "Original issue"}
+        self.calls = 0
+
+    def _work(self, work_type):
+        number = "5" if work_type == "ticket" else "7"
+        prefix = "TKT" if work_type == "ticket" else "ISS"
+        return {
+            "id": f"{DON_PREFIX}:{work_type}/{number}",
+            "display_id": f"{prefix}-{number}",
+            "type": work_type,
+            "title": self.titles[work_type],
+            "created_by": {"display_name": "Customer", "email": "customer@example.com", "type": "user"},
+        }
+
+    @staticmethod
+    def _work_type(object_id):
+        return "issue" if "ISS" in object_id.upper() or ":issue/" in object_id else "ticket"
+
+    def request(self, endpoint, payload):
+        self.calls += 1
+        if endpoint == WORKS_GET:
+            return FakeResponse({"work": self._work(self._work_type(payload["id"]))})
+        if endpoint == WORKS_UPDATE:
+            work_type = payload["type"]
+            self.titles[work_type] = payload.get("title", self.titles[work_type])
+            return FakeResponse({"work": self._work(work_type)})
+        if endpoint == TIMELINE_ENTRIES_LIST:
+            work_type = self._work_type(payload["object"])
+            return FakeResponse({"timeline_entries": [{
+                "id": ENTRY_DON_ID if work_type == "ticket" else f"{ISSUE_DON_ID}/timeline_event/e1",
+                "type": "timeline_comment",
+                "body": self.titles[work_type],
+                "created_by": {"display_name": "Support", "email": "support@example.com"},
+                "created_date": "2025-01-01T00:00:00Z",
+                "artifacts": [{"id": f"{DON_PREFIX}:artifact/a1", "display_id": "ART-1", "file": {"type": "image/png"}}],
+            }]})
+        if endpoint == TIMELINE_ENTRIES_GET:
+            return FakeResponse({"id": payload["id"], "object": "TKT-5", "body": self.titles["ticket"]})
+        if endpoint == TIMELINE_ENTRIES_CREATE:
+            return FakeResponse({"timeline_entry": {"id": f"{payload['object']}/timeline_event/e2"}})
+        if endpoint == LINKS_LIST:
+            return FakeResponse({"links": []})
+        if endpoint == LINK_TYPES_LIST:
+            return FakeResponse({"link_types": []})
+        return FakeResponse({"message": f"unexpected endpoint {endpoint}"}, status_code=400)
+
+
+@pytest.fixture
+def devrev(monkeypatch):
+    api = FakeDevRev()
+    monkeypatch.setattr(utils, "make_devrev_request", api.request)
+    monkeypatch.setattr(server, "devrev_cache", SimpleCache(default_ttl=DEFAULT_CACHE_TTL))
+    return api
+
+
+class FakeClock:
+    """Stands in for the time module in devrev_mcp.cache so expiry can be stepped."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
@@ -0,0 +1,159 @@
+"""
+SimpleCache: TTL expiry, entry and byte budgets, tag bookkeeping and stats().
+"""
+
+from devrev_mcp.cache import SimpleCache
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = SimpleCache(default_ttl=10)
+    cache.set("a", "1")
+    cache.set("b", "2", ttl=30)
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == "2"
+    assert cache.size() == 1
+    assert cache.size_bytes() == 1
+
+
+def test_entry_without_ttl_never_expires(clock):
+    cache = SimpleCache()
+    cache.set("a", "1")
+
+    clock.now += 10 ** 6
+    assert cache.get("a") == "1"
+
+
+def test_expired_entry_drops_its_tag(clock):
+    cache = SimpleCache(default_ttl=10)
+    cache.set("a", "1", tag="ticket:5")
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert cache.delete_tag("ticket:5") == 0
+
+
+def test_evicts_least_recently_used_over_entry_limit():
+    cache = SimpleCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert "b" not in cache
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_evicts_oldest_until_within_byte_budget():
+    cache = SimpleCache(max_bytes=10)
+    cache.set("a", "x" * 4)
+    cache.set("b", "x" * 4)
+    cache.set("c", "x" * 6)
+
+    assert "a" not in cache
+    assert cache.get("b") == "x" * 4
+    assert cache.get("c") == "x" * 6
+    assert cache.size_bytes() == 10
+
+
+def test_value_larger_than_byte_budget_is_not_cached():
+    cache = SimpleCache(max_bytes=10)
+    cache.set("a", "x" * 4)
+    cache.set("b", "x" * 11)
+
+    assert "b" not in cache
+    assert cache.get("a") == "x" * 4
+
+
+def test_byte_budget_counts_utf8_bytes():
+    cache = SimpleCache(max_bytes=10)
+    cache.set("a", "é" * 4)  # 4 characters, 8 bytes
+    assert cache.size_bytes() == 8
+
+    cache.set("b", "xyz")
+    assert "a" not in cache
+    assert cache.size_bytes() == 3
+
+
+def test_overwrite_replaces_size_and_tag():
+    cache = SimpleCache()
+    cache.set("a", "12345", tag="ticket:5")
+    cache.set("a", "12", tag="issue:7")
+
+    assert cache.size() == 1
+    assert cache.size_bytes() == 2
+    assert cache.delete_tag("ticket:5") == 0
+    assert cache.delete_tag("issue:7") == 1
+    assert cache.size_bytes() == 0
+
+
+def test_overwrite_without_tag_untags_key():
+    cache = SimpleCache()
+    cache.set("a", "1", tag="ticket:5")
+    cache.set("a", "2")
+
+    assert cache.delete_tag("ticket:5") == 0
+    assert cache.get("a") == "2"
+
+
+def test_delete_tag_removes_every_tagged_entry():
+    cache = SimpleCache()
+    cache.set("devrev://tickets/5", "1", tag="ticket:5")
+    cache.set("ticket_timeline:5", "22", tag="ticket:5")
+    cache.set("devrev://issues/7", "333", tag="issue:7")
+
+    assert cache.delete_tag("ticket:5") == 2
+    assert cache.size() == 1
+    assert cache.size_bytes() == 3
+    assert cache.delete_tag("ticket:5") == 0
+
+
+def test_eviction_drops_tag_of_evicted_key():
+    cache = SimpleCache(max_size=1)
+    cache.set("a", "1", tag="ticket:5")
+    cache.set("b", "2", tag="ticket:5")
+
+    assert "a" not in cache
+    assert cache.delete_tag("ticket:5") == 1
+    assert cache.size() == 0
+
+
+def test_delete_drops_tag():
+    cache = SimpleCache()
+    cache.set("a", "1", tag="ticket:5")
+
+    assert cache.delete("a") is True
+    assert cache.delete("a") is False
+    assert cache.delete_tag("ticket:5") == 0
+
+
+def test_dict_values_are_stored_as_compact_json():
+    cache = SimpleCache()
+    cache.set("a", {"id": 1, "tags": ["x"]})
+
+    assert cache.get("a") == '{"id":1,"tags":["x"]}'
+
+
+def test_stats_reports_usage_and_hit_rate():
+    cache = SimpleCache(max_size=3, max_bytes=100, default_ttl=60)
+    assert cache.stats()["hit_rate"] == 0
+
+    cache.set("a", "1234")
+    cache.get("a")
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+
+    assert cache.stats() == {
+        "entries": 1,
+        "max_entries": 3,
+        "bytes": 4,
+        "max_bytes": 100,
+        "default_ttl": 60,
+        "hits": 3,
+        "misses": 1,
+        "hit_rate": 0.75,
+    }
@@ -0,0 +1,112 @@
+"""
+Writes through the update_object and create_timeline_comment tools must drop every
+cached view of the changed work item, whichever URI form it was read through.
+"""
+
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+import devrev_mcp.server as server
+from devrev_mcp.resources.timeline_entry import timeline_entry as timeline_entry_resource
+
+from conftest import ENTRY_DON_ID, ISSUE_DON_ID, TICKET_DON_ID
+
+TICKET_URIS = [
+    "devrev://tickets/5",
+    "devrev://tickets/TKT-5",
+    f"devrev://tickets/{TICKET_DON_ID}",
+    "devrev://tickets/5/timeline",
+    "devrev://timeline/TKT-5",
+    "devrev://tickets/5/timeline/e1",
+    "devrev://tickets/TKT-5/timeline/e1",
+    "devrev://tickets/5/artifacts",
+    "devrev://tickets/TKT-5/artifacts",
+    "devrev://works/TKT-5",
+    "devrev://works/5",
+]
+
+ISSUE_URIS = [
+    "devrev://issues/7",
+    "devrev://issues/ISS-7",
+    "devrev://issues/7/timeline",
+    "devrev://issues/ISS-7/timeline",
+    "devrev://issues/7/artifacts",
+    "devrev://issues/ISS-7/artifacts",
+    "devrev://works/ISS-7",
+]
+
+
+async def _read(client, uri):
+    contents = await client.read_resource(uri)
+    return contents[0].text
+
+
+async def _assert_refetched_after_write(devrev, uri, write):
+    async with Client(server.mcp) as client:
+        await _read(client, uri)
+
+        # A second read is served from the cache...
+        calls = devrev.calls
+        await _read(client, uri)
+        assert devrev.calls == calls
+
+        await write(client)
+
+        # ...but the first read after the write goes back to the API
+        calls = devrev.calls
+        await _read(client, uri)
+        assert devrev.calls > calls, f"{uri} was served stale after the write"
+
+
+@pytest.mark.parametrize("uri", TICKET_URIS)
+@pytest.mark.parametrize("work_id", ["TKT-5", "5", TICKET_DON_ID])
+def test_update_object_invalidates_ticket_views(devrev, uri, work_id):
+    async def write(client):
+        await client.call_tool("update_object", {"id": work_id, "type": "ticket", "title": "Renamed ticket"})
+
+    asyncio.run(_assert_refetched_after_write(devrev, uri, write))
+
+
+@pytest.mark.parametrize("uri", ISSUE_URIS)
+@pytest.mark.parametrize("work_id", ["ISS-7", "7", ISSUE_DON_ID])
+def test_update_object_invalidates_issue_views(devrev, uri, work_id):
+    async def write(client):
+        await client.call_tool("update_object", {"id": work_id, "type": "issue", "title": "Renamed issue"})
+
+    asyncio.run(_assert_refetched_after_write(devrev, uri, write))
+
+
+@pytest.mark.parametrize("uri", TICKET_URIS)
+def test_create_timeline_comment_invalidates_ticket_views(devrev, uri):
+    async def write(client):
+        await client.call_tool("create_timeline_comment", {"work_id": "TKT-5", "body": "Internal note"})
+
+    asyncio.run(_assert_refetched_after_write(devrev, uri, write))
+
+
+def test_update_object_invalidates_full_id_timeline_entries(devrev):
+    async def scenario():
+        async with Client(server.mcp) as client:
+            # Full don:core entry IDs contain "/", so they are read through the resource directly
+            class Ctx:
+                async def info(self, message): pass
+                async def error(self, message): pass
+
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache, ticket_number="5")
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache)
+            calls = devrev.calls
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache, ticket_number="5")
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache)
+            assert devrev.calls == calls
+
+            await client.call_tool("update_object", {"id": "TKT-5", "type": "ticket", "title": "Renamed ticket"})
+
+            calls = devrev.calls
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache, ticket_number="5")
+            assert devrev.calls == calls + 1
+            await timeline_entry_resource(ENTRY_DON_ID, Ctx(), server.devrev_cache)
+            assert devrev.calls == calls + 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,52 @@
+"""
+A 404 from DevRev is cached for NOT_FOUND_TTL, so repeated reads of a missing
+object do not hammer the API but it is looked up again soon after.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastmcp import Client
+
+import devrev_mcp.server as server
+import devrev_mcp.utils as utils
+from devrev_mcp.cache import DEFAULT_CACHE_TTL
+from devrev_mcp.endpoints import WORKS_GET
+from devrev_mcp.error_handler import NOT_FOUND_TTL, is_error_response
+
+from conftest import FakeResponse
+
+
+@pytest.fixture
+def missing_works(devrev, monkeypatch):
+    """Make works.get answer 404 while leaving the rest of the fake API in place."""
+    def request(endpoint, payload):
+        if endpoint == WORKS_GET:
+            devrev.calls += 1
+            return FakeResponse({"message": "work not found"}, status_code=404)
+        return devrev.request(endpoint, payload)
+
+    monkeypatch.setattr(utils, "make_devrev_request", request)
+
+
+@pytest.mark.parametrize("uri", ["devrev://tickets/5", "devrev://tickets/5/timeline"])
+def test_not_found_is_cached_briefly(devrev, missing_works, clock, uri):
+    assert NOT_FOUND_TTL < DEFAULT_CACHE_TTL
+
+    async def scenario():
+        async with Client(server.mcp) as client:
+            first = (await client.read_resource(uri))[0].text
+            assert is_error_response(json.loads(first))
+
+            # Repeated reads inside the window reuse the cached 404
+            calls = devrev.calls
+            assert (await client.read_resource(uri))[0].text == first
+            assert devrev.calls == calls
+
+            # Once it expires the object is looked up again
+            clock.now += NOT_FOUND_TTL
+            await client.read_resource(uri)
+            assert devrev.calls > calls
+
+    asyncio.run(scenario())
@@ -0,0 +1,42 @@
+"""
+DEVREV_PREFETCH_IDS are warmed in the background once the server is running,
+without holding up client requests.
+"""
+
+import asyncio
+
+from fastmcp import Client
+
+import devrev_mcp.server as server
+
+
+def test_prefetch_warms_timeline_in_background(devrev, monkeypatch):
+    monkeypatch.setenv("DEVREV_PREFETCH_IDS", "TKT-5, 6")
+
+    async def scenario():
+        async with Client(server.mcp) as client:
+            # The warm-up runs as a task on the server loop; give it a few turns
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            calls = devrev.calls
+            await client.read_resource("devrev://tickets/5/timeline")
+            await client.read_resource("devrev://works/TKT-6")
+            assert devrev.calls == calls
+
+    asyncio.run(scenario())
+
+
+def test_prefetch_gives_up_after_timeout(devrev, monkeypatch):
+    monkeypatch.setattr(server, "PREFETCH_TIMEOUT", 0.01)
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(server, "work_resource", hang)
+    monkeypatch.setattr(server, "timeline_resource", hang)
+
+    async def scenario():
+        await asyncio.wait_for(server._prefetch_tickets(["5"]), timeout=1)
+
+    asyncio.run(scenario())
@@ -0,0 +1,43 @@
+"""
+The ticket resource combines the work item, its timeline and its linked work items.
+"""
+
+import asyncio
+import json
+
+from fastmcp import Client
+
+import devrev_mcp.resources.ticket as ticket_module
+import devrev_mcp.server as server
+
+
+async def _read_json(uri):
+    async with Client(server.mcp) as client:
+        contents = await client.read_resource(uri)
+    return json.loads(contents[0].text)
+
+
+def test_linked_items_failure_keeps_the_timeline(devrev, monkeypatch):
+    async def failing_links(**kwargs):
+        raise RuntimeError("links unavailable")
+
+    monkeypatch.setattr(ticket_module, "fetch_linked_work_items", failing_links)
+    ticket = asyncio.run(_read_json("devrev://tickets/5"))
+
+    assert ticket["title"] == "Original ticket"
+    assert ticket["links"]["works"] == []
+    assert ticket["links"]["timeline"]["summary"]["ticket_id"] == "5"
+    assert ticket["links"]["artifacts"]["artifacts"]
+
+
+def test_timeline_failure_keeps_linked_items_and_is_not_cached(devrev, monkeypatch):
+    async def failing_read(ctx, uri, parse_json=False):
+        raise RuntimeError("timeline unavailable")
+
+    monkeypatch.setattr(ticket_module, "read_resource_content", failing_read)
+    ticket = asyncio.run(_read_json("devrev://tickets/5"))
+
+    assert ticket["title"] == "Original ticket"
+    assert ticket["links"]["works"] == []
+    assert ticket["links"]["timeline"]["error"] is True
+    assert "devrev://tickets/5" not in server.devrev_cache
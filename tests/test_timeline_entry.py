@@ -0,0 +1,37 @@
+"""
+Timeline entries requested by short ID are picked out of the ticket timeline.
+"""
+
+import asyncio
+import json
+
+from fastmcp import Client
+
+import devrev_mcp.server as server
+
+
+async def _read_json(uri):
+    async with Client(server.mcp) as client:
+        contents = await client.read_resource(uri)
+    return json.loads(contents[0].text)
+
+
+def test_short_entry_id_returns_only_that_entry(devrev):
+    entry = asyncio.run(_read_json("devrev://tickets/TKT-5/timeline/e1"))
+
+    assert entry["timeline_entry_uri"] == "devrev://tickets/5/timeline/e1"
+    assert entry["links"] == {
+        "ticket": "devrev://tickets/5",
+        "timeline": "devrev://tickets/5/timeline"
+    }
+    assert "conversation_thread" not in entry
+
+
+def test_unknown_short_entry_id_is_not_found(devrev):
+    result = asyncio.run(_read_json("devrev://tickets/5/timeline/missing"))
+
+    assert result["error"] is True
+    assert result["error_code"] == "RESOURCE_NOT_FOUND"
+    assert result["resource_type"] == "timeline_entry"
+    assert result["resource_id"] == "missing"
+    assert "conversation_thread" not in result
@@ -0,0 +1,84 @@
+"""
+Shared helpers: single_flight call sharing and append_json_field splicing.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from devrev_mcp.utils import append_json_field, single_flight
+
+
+def test_single_flight_shares_concurrent_calls_per_id():
+    calls = []
+
+    @single_flight
+    async def fetch(resource_id, suffix=""):
+        calls.append(resource_id)
+        await asyncio.sleep(0.01)
+        return resource_id + suffix
+
+    async def scenario():
+        results = await asyncio.gather(fetch("5"), fetch("5", suffix="!"), fetch("7"))
+        assert results == ["5", "5", "7"]
+        assert sorted(calls) == ["5", "7"]
+
+        # Nothing is kept once the call finishes
+        assert await fetch("5") == "5"
+        assert calls.count("5") == 2
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_shares_exceptions_and_clears_failed_call():
+    calls = []
+
+    @single_flight
+    async def fetch(resource_id):
+        calls.append(resource_id)
+        await asyncio.sleep(0.01)
+        raise ValueError(resource_id)
+
+    async def scenario():
+        results = await asyncio.gather(fetch("5"), fetch("5"), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert calls == ["5"]
+
+        with pytest.raises(ValueError):
+            await fetch("5")
+        assert calls == ["5", "5"]
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_caller_cancellation_does_not_cancel_shared_call():
+    @single_flight
+    async def fetch(resource_id):
+        await asyncio.sleep(0.01)
+        return resource_id
+
+    async def scenario():
+        first = asyncio.ensure_future(fetch("5"))
+        second = asyncio.ensure_future(fetch("5"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "5"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("payload", ['{"a":1}', '{ "a": [1, 2] }\n', "{}", "{ }"])
+def test_append_json_field_matches_decoded_update(payload):
+    expected = json.loads(payload)
+    expected["links"] = {"ticket": "devrev://tickets/5", "note": "café"}
+
+    result = append_json_field(payload, "links", expected["links"])
+
+    assert json.loads(result) == expected
+
+
+@pytest.mark.parametrize("payload", ["[1, 2]", '"text"', ""])
+def test_append_json_field_rejects_non_objects(payload):
+    with pytest.raises(ValueError):
+        append_json_field(payload, "links", {})